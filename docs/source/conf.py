@@ -34,6 +34,11 @@ version = "0.1.0"
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
+#
+# All of these declare parallel_read_safe / parallel_write_safe, so the docs
+# are built with ``sphinx-build -j auto`` (see docs/Makefile and the root
+# Makefile). Check that any extension added here is parallel-safe as well,
+# otherwise Sphinx silently falls back to a serial build.
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.autosummary",
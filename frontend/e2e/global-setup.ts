@@ -41,11 +41,15 @@ async function globalSetup() {
 		}
 	`;
 
+	// Seeded names share one timestamp: it identifies this setup run, and every
+	// name already carries a distinct prefix
+	const timestamp = Date.now();
+
 	// Test database connectivity with a simple project creation
 	try {
 		const testResult = await testGraphQLClient
 			.mutation(CREATE_PROJECT_MUTATION, {
-				name: `DB-Test-${Date.now()}`,
+				name: `DB-Test-${timestamp}`,
 				description: 'Database connectivity test'
 			})
 			.toPromise();
@@ -64,7 +68,7 @@ async function globalSetup() {
 	// Create "Medical Images Dataset" project with unique name
 	const medicalResult = await testGraphQLClient
 		.mutation(CREATE_PROJECT_MUTATION, {
-			name: `Medical Images Dataset-${Date.now()}`,
+			name: `Medical Images Dataset-${timestamp}`,
 			description:
 				'A comprehensive dataset of medical imaging data for AI training and research purposes.'
 		})
@@ -81,7 +85,7 @@ async function globalSetup() {
 	// Create "Vehicle Detection" project with unique name
 	const vehicleResult = await testGraphQLClient
 		.mutation(CREATE_PROJECT_MUTATION, {
-			name: `Vehicle Detection-${Date.now()}`,
+			name: `Vehicle Detection-${timestamp}`,
 			description:
 				'Dataset for training vehicle detection models with various types of vehicles and road conditions.'
 		})
@@ -95,11 +99,11 @@ async function globalSetup() {
 	// Create a few more test projects for variety with unique names
 	const additionalProjects = [
 		{
-			name: `Wildlife Conservation-${Date.now()}`,
+			name: `Wildlife Conservation-${timestamp}`,
 			description: 'Tracking and identifying endangered species through camera trap images.'
 		},
 		{
-			name: `Agricultural Monitoring-${Date.now()}`,
+			name: `Agricultural Monitoring-${timestamp}`,
 			description: 'Satellite and drone imagery for crop health assessment and yield prediction.'
 		}
 	];
@@ -126,7 +130,6 @@ async function globalSetup() {
 	`;
 
 	// Create a few test images using data URLs with unique timestamps
-	const timestamp = Date.now();
 	const testImages = [
 		'data:image/svg+xml;base64,' +
 			btoa(`<svg width="800" height="600" xmlns="http://www.w3.org/2000/svg">
@@ -146,15 +149,16 @@ async function globalSetup() {
 			</svg>`)
 	];
 
-	for (let i = 0; i < testImages.length; i++) {
-		const result = await testGraphQLClient
-			.mutation(CREATE_IMAGE_MUTATION, { url: testImages[i] })
-			.toPromise();
+	// The images are independent, so create them concurrently
+	const imageResults = await Promise.all(
+		testImages.map((url) => testGraphQLClient.mutation(CREATE_IMAGE_MUTATION, { url }).toPromise())
+	);
+	imageResults.forEach((result, i) => {
 		if (result.error) {
 			throw new Error(`Failed to create test image ${i + 1}: ${result.error.message}`);
 		}
 		console.log(`Created test image ${i + 1}`);
-	}
+	});
 
 	console.log('Global setup completed');
 }
@@ -19,13 +19,13 @@ async function globalTeardown() {
 		}
 	`;
 
-	// Query for all images
+	// Query for all images. Only the ids are needed: the urls of seeded images
+	// are whole base64 data URLs and are not worth transferring just to delete them
 	const GET_IMAGES_QUERY = `
 		query GetImages {
 			images(limit: 100, offset: 0) {
 				objects {
 					id
-					url
 				}
 			}
 		}
@@ -37,7 +37,6 @@ async function globalTeardown() {
 			tasks(limit: 100, offset: 0) {
 				objects {
 					id
-					status
 				}
 			}
 		}
@@ -70,14 +69,18 @@ async function globalTeardown() {
 				const tasks = taskResult.data.tasks.objects;
 				console.log(`Found ${tasks.length} tasks to clean up`);
 
-				for (const task of tasks) {
-					try {
-						await testGraphQLClient.mutation(DELETE_TASK_MUTATION, { id: task.id }).toPromise();
-						console.log(`Deleted task: ${task.id}`);
-					} catch (error) {
-						console.log(`Error deleting task ${task.id}:`, error);
-					}
-				}
+				// Tasks are independent of each other, so delete them concurrently
+
+				await Promise.all(
+					tasks.map(async (task: { id: string }) => {
+						try {
+							await testGraphQLClient.mutation(DELETE_TASK_MUTATION, { id: task.id }).toPromise();
+							console.log(`Deleted task: ${task.id}`);
+						} catch (error) {
+							console.log(`Error deleting task ${task.id}:`, error);
+						}
+					})
+				);
 			}
 		} catch (error) {
 			console.log('Error cleaning up tasks:', error);
@@ -91,14 +94,16 @@ async function globalTeardown() {
 				const images = imageResult.data.images.objects;
 				console.log(`Found ${images.length} images to clean up`);
 
-				for (const image of images) {
-					try {
-						await testGraphQLClient.mutation(DELETE_IMAGE_MUTATION, { id: image.id }).toPromise();
-						console.log(`Deleted image: ${image.id}`);
-					} catch (error) {
-						console.log(`Error deleting image ${image.id}:`, error);
-					}
-				}
+				await Promise.all(
+					images.map(async (image: { id: string }) => {
+						try {
+							await testGraphQLClient.mutation(DELETE_IMAGE_MUTATION, { id: image.id }).toPromise();
+							console.log(`Deleted image: ${image.id}`);
+						} catch (error) {
+							console.log(`Error deleting image ${image.id}:`, error);
+						}
+					})
+				);
 			}
 		} catch (error) {
 			console.log('Error cleaning up images (some may have invalid URLs):', error);
@@ -111,15 +116,17 @@ async function globalTeardown() {
 			const projects = result.data.projects.objects;
 			console.log(`Found ${projects.length} projects to clean up`);
 
-			// Delete each project
-			for (const project of projects) {
-				try {
-					await testGraphQLClient.mutation(DELETE_PROJECT_MUTATION, { id: project.id }).toPromise();
-					console.log(`Deleted project: ${project.name}`);
-				} catch (error) {
-					console.log(`Error deleting project ${project.name}:`, error);
-				}
-			}
+			// Delete the projects concurrently; each one is independent
+			await Promise.all(
+				projects.map(async (project: { id: string; name: string }) => {
+					try {
+						await testGraphQLClient.mutation(DELETE_PROJECT_MUTATION, { id: project.id }).toPromise();
+						console.log(`Deleted project: ${project.name}`);
+					} catch (error) {
+						console.log(`Error deleting project ${project.name}:`, error);
+					}
+				})
+			);
 		}
 	} catch (error) {
 		console.log('Error during teardown:', error);
@@ -0,0 +1,24 @@
+import { describe, it, expect } from 'vitest';
+import { generateSampleImage, generateTestImage } from '../image-generator';
+
+const DATA_URL_PREFIX = 'data:image/svg+xml;base64,';
+
+function decodeSvg(dataUrl: string): string {
+	expect(dataUrl.startsWith(DATA_URL_PREFIX)).toBe(true);
+	return Buffer.from(dataUrl.slice(DATA_URL_PREFIX.length), 'base64').toString('utf8');
+}
+
+describe('Image Generator', () => {
+	it('should encode sample image labels containing emoji', () => {
+		const svg = decodeSvg(generateSampleImage('medical', 'abc'));
+
+		expect(svg).toContain('🏥 Medical Image abc');
+	});
+
+	it('should encode non-ASCII text in test images', () => {
+		const svg = decodeSvg(generateTestImage({ text: 'Café ✓' }));
+
+		expect(svg).toContain('Café ✓');
+		expect(svg).toContain('<svg');
+	});
+});
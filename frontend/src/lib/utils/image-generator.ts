@@ -110,7 +110,20 @@ function generateSVGDataUrl(
 	`;
 
 	// Convert to base64 data URL
-	return `data:image/svg+xml;base64,${btoa(svg)}`;
+	return `data:image/svg+xml;base64,${encodeBase64(svg)}`;
+}
+
+const utf8Encoder = new TextEncoder();
+
+/**
+ * Base64-encode a string as UTF-8 (btoa alone rejects characters such as emoji)
+ */
+function encodeBase64(value: string): string {
+	let binary = '';
+	for (const byte of utf8Encoder.encode(value)) {
+		binary += String.fromCharCode(byte);
+	}
+	return btoa(binary);
 }
 
 /**
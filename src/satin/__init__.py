@@ -1,3 +1,19 @@
-from satin.main import app
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    app: FastAPI
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    """Create the ASGI application lazily so ``import satin`` stays cheap."""
+    if name == "app":
+        from satin.main import create_app  # noqa: PLC0415
+
+        globals()["app"] = app = create_app()
+        return app
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
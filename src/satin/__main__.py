@@ -1,8 +1,6 @@
 """Main entry point for running the Satin application with Granian ASGI server."""
 
 import click
-from granian import Granian
-from granian.constants import Interfaces
 
 
 @click.command()
@@ -24,19 +22,35 @@ from granian.constants import Interfaces
     show_default=True,
     help="Enable auto-reload.",
 )
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help=(
+        "Number of worker processes. Caches and rate limits are kept per process, so with "
+        "several workers reads can be stale for up to 5 minutes after a write and every "
+        "rate limit is multiplied by the worker count."
+    ),
+)
 @click.option(
     "--log-level",
     default="info",
     show_default=True,
     help="Logging level.",
 )
-def cli(host: str, port: int, reload: bool, log_level: str):
+def cli(host: str, port: int, reload: bool, workers: int, log_level: str):
     """Run the Satin application using Granian ASGI server."""
+    from granian import Granian  # noqa: PLC0415
+    from granian.constants import Interfaces  # noqa: PLC0415
+
     server = Granian(
-        target="satin.main:app",
+        target="satin.main:create_app",
+        factory=True,
         address=host,
         port=port,
         interface=Interfaces.ASGI,
+        workers=workers,
         reload=reload,
         log_level=log_level,  # type: ignore[arg-type]
     )
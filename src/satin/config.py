@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import Field, MongoDsn
 from pydantic_settings import BaseSettings
 
@@ -21,6 +23,12 @@ class Config(BaseSettings):
         ],
     )
 
+    cors_origin_regex: str | None = Field(
+        validation_alias="CORS_ORIGIN_REGEX",
+        default=None,
+        description=r"Regex of allowed CORS origins, e.g. ^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+    )
+
     # Rate limiting configuration
     disable_rate_limiting: bool = Field(
         validation_alias="DISABLE_RATE_LIMITING",
@@ -48,4 +56,16 @@ class Config(BaseSettings):
     )
 
 
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the application configuration.
+
+    The settings are parsed from the environment only once and the same
+    instance is returned on subsequent calls, so this is cheap enough to use
+    on hot paths and as a FastAPI dependency.
+
+    Returns:
+        The shared Config instance.
+
+    """
+    return Config()
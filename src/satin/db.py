@@ -1,9 +1,12 @@
 import logging
+from functools import cache
 
+from pydantic import MongoDsn
 from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.errors import ConfigurationError
 
-from .config import config
+from .config import get_config
 
 # Error messages
 NO_AUTH_NON_LOCAL_ERROR = (
@@ -25,36 +28,68 @@ def _raise_database_name_error() -> None:
     raise ConfigurationError(NO_DATABASE_NAME_ERROR)
 
 
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "[::1]"})
+
+
 # Validate MongoDB connection string has authentication if not localhost
-def validate_mongo_connection(dsn: str) -> None:
-    """Validate MongoDB connection string has proper authentication."""
-    dsn_str = str(dsn)
+def validate_mongo_connection(dsn: MongoDsn) -> None:
+    """Validate MongoDB connection string has proper authentication.
+
+    The scheme and host structure are already checked by pydantic when the
+    settings are loaded, so only the credentials policy is enforced here.
+    """
+    first_host = dsn.hosts()[0]
+    username = first_host["username"]
     # Skip validation for local development without auth
-    if "localhost" in dsn_str or "127.0.0.1" in dsn_str:
-        if "@" not in dsn_str:
+    if (first_host["host"] or "").lower() in LOCAL_HOSTS:
+        if username is None:
             logger.warning("MongoDB connection does not use authentication. This should only be used in development.")
     # For non-local connections, require authentication
-    elif "@" not in dsn_str:
+    elif username is None:
         _raise_auth_error()
 
 
-# Validate connection string
-validate_mongo_connection(str(config.mongo_dsn))
+@cache
+def get_client() -> AsyncMongoClient:
+    """Get the MongoDB client, creating it on first use.
+
+    Returns:
+        The shared AsyncMongoClient for the configured DSN.
+
+    """
+    mongo_dsn = get_config().mongo_dsn
 
-# instantiate mongo client with connection validation
-try:
-    client: AsyncMongoClient = AsyncMongoClient(
-        str(config.mongo_dsn),
+    # Validate connection string
+    validate_mongo_connection(mongo_dsn)
+
+    return AsyncMongoClient(
+        str(mongo_dsn),
         serverSelectionTimeoutMS=30000,  # 30 second timeout for initial connection
         connectTimeoutMS=30000,  # 30 second connection timeout
         socketTimeoutMS=30000,  # 30 second socket timeout
+        minPoolSize=2,  # Keep a couple of sockets warm per worker
+        maxPoolSize=50,
     )
-    db = client.get_default_database()
 
-    # Validate database name is specified
-    if db.name is None:
-        _raise_database_name_error()
 
-except Exception:
-    logger.exception("Failed to connect to MongoDB")
-    raise
+@cache
+def get_db() -> AsyncDatabase:
+    """Get the default database named in the DSN, creating the client on first use.
+
+    Returns:
+        The application database.
+
+    """
+    # instantiate mongo client with connection validation
+    try:
+        db = get_client().get_default_database()
+
+        # Validate database name is specified
+        if db.name is None:
+            _raise_database_name_error()
+
+    except Exception:
+        logger.exception("Failed to connect to MongoDB")
+        raise
+    else:
+        return db
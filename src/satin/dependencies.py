@@ -0,0 +1,38 @@
+"""Application-wide dependencies shared by the GraphQL resolvers."""
+
+from contextvars import ContextVar, Token
+from functools import cache
+
+from satin.db import get_db
+from satin.repositories import RepositoryFactory
+
+# Resolvers look the factory up here, so a request can be served by other repositories
+_repo_factory_var: ContextVar[RepositoryFactory | None] = ContextVar("repo_factory", default=None)
+
+
+@cache
+def get_default_repo_factory() -> RepositoryFactory:
+    """Get the shared repository factory, connecting to the configured database on first use.
+
+    Queries and mutations share one factory, so writes invalidate the caches reads use.
+    """
+    return RepositoryFactory(get_db())
+
+
+def get_repo_factory() -> RepositoryFactory:
+    """Get the repository factory for the current request."""
+    factory = _repo_factory_var.get()
+    return get_default_repo_factory() if factory is None else factory
+
+
+def set_repo_factory(factory: RepositoryFactory) -> Token[RepositoryFactory | None]:
+    """Use the given repository factory for the rest of the current context.
+
+    Args:
+        factory: The repository factory resolvers should use
+
+    Returns:
+        Token that can be passed to ``ContextVar.reset`` to restore the previous factory.
+
+    """
+    return _repo_factory_var.set(factory)
@@ -1,8 +1,26 @@
 """Custom exception classes for the application."""
 
+from functools import lru_cache
+
 from satin.constants import ERROR_MESSAGES
 
 
+@lru_cache(maxsize=128)
+def _format_message(key: str, **kwargs: object) -> str:
+    """Format an error message template.
+
+    Only used for messages whose arguments come from the fixed application
+    limits, so the same few strings are built once and then reused.
+    """
+    return ERROR_MESSAGES[key].format(**kwargs)
+
+
+@lru_cache(maxsize=16)
+def _string_too_long_message(max_length: int) -> str:
+    """Build the message for a string exceeding max_length."""
+    return f"{ERROR_MESSAGES['STRING_TOO_LONG']} of {max_length}"
+
+
 class ValidationError(Exception):
     """Base exception for validation errors."""
 
@@ -21,156 +39,178 @@ class ValidationError(Exception):
 class InputSanitizationError(ValidationError):
     """Exception raised when input sanitization fails."""
 
+    _EMPTY_STRING = ERROR_MESSAGES["EMPTY_STRING"]
+    _EXPECTED_STRING = ERROR_MESSAGES["EXPECTED_STRING"]
+
     @classmethod
     def empty_string(cls) -> "InputSanitizationError":
         """Create error for empty string."""
-        return cls(ERROR_MESSAGES["EMPTY_STRING"])
+        return cls(cls._EMPTY_STRING)
 
     @classmethod
     def string_too_long(cls, max_length: int) -> "InputSanitizationError":
         """Create error for string too long."""
-        message = ERROR_MESSAGES["STRING_TOO_LONG"] + f" of {max_length}"
-        return cls(message)
+        return cls(_string_too_long_message(max_length))
 
     @classmethod
     def expected_string(cls, type_name: str) -> "InputSanitizationError":
         """Create error for wrong type."""
-        message = ERROR_MESSAGES["EXPECTED_STRING"].format(type_name=type_name)
+        message = cls._EXPECTED_STRING.format(type_name=type_name)
         return cls(message)
 
 
 class ObjectIdValidationError(ValidationError):
     """Exception raised when ObjectId validation fails."""
 
+    _EMPTY_ID = ERROR_MESSAGES["EMPTY_ID"]
+    _INVALID_ID_LENGTH = ERROR_MESSAGES["INVALID_ID_LENGTH"]
+    _INVALID_ID_FORMAT = ERROR_MESSAGES["INVALID_ID_FORMAT"]
+    _INVALID_ID_CHARACTERS = ERROR_MESSAGES["INVALID_ID_CHARACTERS"]
+    _INVALID_OBJECT_ID = ERROR_MESSAGES["INVALID_OBJECT_ID"]
+
     @classmethod
     def empty_id(cls) -> "ObjectIdValidationError":
         """Create error for empty ID."""
-        return cls(ERROR_MESSAGES["EMPTY_ID"])
+        return cls(cls._EMPTY_ID)
 
     @classmethod
     def invalid_length(cls) -> "ObjectIdValidationError":
         """Create error for invalid ID length."""
-        return cls(ERROR_MESSAGES["INVALID_ID_LENGTH"])
+        return cls(cls._INVALID_ID_LENGTH)
 
     @classmethod
     def invalid_format(cls) -> "ObjectIdValidationError":
         """Create error for invalid ID format."""
-        return cls(ERROR_MESSAGES["INVALID_ID_FORMAT"])
+        return cls(cls._INVALID_ID_FORMAT)
 
     @classmethod
     def invalid_characters(cls) -> "ObjectIdValidationError":
         """Create error for invalid characters."""
-        return cls(ERROR_MESSAGES["INVALID_ID_CHARACTERS"])
+        return cls(cls._INVALID_ID_CHARACTERS)
 
     @classmethod
     def invalid_object_id(cls, error: str) -> "ObjectIdValidationError":
         """Create error for invalid ObjectId."""
-        message = ERROR_MESSAGES["INVALID_OBJECT_ID"].format(error=error)
+        message = cls._INVALID_OBJECT_ID.format(error=error)
         return cls(message)
 
 
 class FieldNameValidationError(ValidationError):
     """Exception raised when field name validation fails."""
 
+    _EMPTY_FIELD_NAME = ERROR_MESSAGES["EMPTY_FIELD_NAME"]
+    _FIELD_NAME_TOO_LONG = ERROR_MESSAGES["FIELD_NAME_TOO_LONG"]
+    _INVALID_FIELD_FORMAT = ERROR_MESSAGES["INVALID_FIELD_FORMAT"]
+    _FIELD_NOT_ALLOWED = ERROR_MESSAGES["FIELD_NOT_ALLOWED"]
+    _FIELD_STARTS_WITH_DOLLAR = ERROR_MESSAGES["FIELD_STARTS_WITH_DOLLAR"]
+
     @classmethod
     def empty_field_name(cls) -> "FieldNameValidationError":
         """Create error for empty field name."""
-        return cls(ERROR_MESSAGES["EMPTY_FIELD_NAME"])
+        return cls(cls._EMPTY_FIELD_NAME)
 
     @classmethod
     def field_name_too_long(cls) -> "FieldNameValidationError":
         """Create error for field name too long."""
-        return cls(ERROR_MESSAGES["FIELD_NAME_TOO_LONG"])
+        return cls(cls._FIELD_NAME_TOO_LONG)
 
     @classmethod
     def invalid_format(cls) -> "FieldNameValidationError":
         """Create error for invalid field format."""
-        return cls(ERROR_MESSAGES["INVALID_FIELD_FORMAT"])
+        return cls(cls._INVALID_FIELD_FORMAT)
 
     @classmethod
     def field_not_allowed(cls, field: str) -> "FieldNameValidationError":
         """Create error for disallowed field."""
-        message = ERROR_MESSAGES["FIELD_NOT_ALLOWED"].format(field=field)
+        message = cls._FIELD_NOT_ALLOWED.format(field=field)
         return cls(message)
 
     @classmethod
     def starts_with_dollar(cls) -> "FieldNameValidationError":
         """Create error for field starting with $."""
-        return cls(ERROR_MESSAGES["FIELD_STARTS_WITH_DOLLAR"])
+        return cls(cls._FIELD_STARTS_WITH_DOLLAR)
 
 
 class ProjectValidationError(ValidationError):
     """Exception raised when project validation fails."""
 
+    _PROJECT_NAME_INVALID_CHARS = ERROR_MESSAGES["PROJECT_NAME_INVALID_CHARS"]
+
     @classmethod
     def invalid_characters(cls) -> "ProjectValidationError":
         """Create error for invalid characters in project name."""
-        return cls(ERROR_MESSAGES["PROJECT_NAME_INVALID_CHARS"])
+        return cls(cls._PROJECT_NAME_INVALID_CHARS)
 
 
 class TagValidationError(ValidationError):
     """Exception raised when tag validation fails."""
 
+    _TAG_EMPTY_OR_WHITESPACE = ERROR_MESSAGES["TAG_EMPTY_OR_WHITESPACE"]
+
     @classmethod
     def empty_or_whitespace(cls) -> "TagValidationError":
         """Create error for empty or whitespace tag."""
-        return cls(ERROR_MESSAGES["TAG_EMPTY_OR_WHITESPACE"])
+        return cls(cls._TAG_EMPTY_OR_WHITESPACE)
 
     @classmethod
     def too_many_tags(cls, max_count: int) -> "TagValidationError":
         """Create error for too many tags."""
-        message = ERROR_MESSAGES["TOO_MANY_TAGS"].format(max_count=max_count)
-        return cls(message)
+        return cls(_format_message("TOO_MANY_TAGS", max_count=max_count))
 
 
 class CoordinateValidationError(ValidationError):
     """Exception raised when coordinate validation fails."""
 
+    _COORDINATE_NEGATIVE = ERROR_MESSAGES["COORDINATE_NEGATIVE"]
+
     @classmethod
     def negative_coordinate(cls, field_name: str) -> "CoordinateValidationError":
         """Create error for negative coordinate."""
-        message = ERROR_MESSAGES["COORDINATE_NEGATIVE"].format(field_name=field_name)
+        message = cls._COORDINATE_NEGATIVE.format(field_name=field_name)
         return cls(message, field_name=field_name)
 
     @classmethod
     def exceeds_maximum(cls, field_name: str, max_value: int) -> "CoordinateValidationError":
         """Create error for coordinate exceeding maximum."""
-        message = ERROR_MESSAGES["COORDINATE_EXCEEDS_MAX"].format(field_name=field_name, max_value=max_value)
+        message = _format_message("COORDINATE_EXCEEDS_MAX", field_name=field_name, max_value=max_value)
         return cls(message, field_name=field_name)
 
 
 class FilterValidationError(ValidationError):
     """Exception raised when filter validation fails."""
 
+    _NUMERIC_FILTER_INVALID = ERROR_MESSAGES["NUMERIC_FILTER_INVALID"]
+
     @classmethod
     def numeric_filter_invalid(cls, type_name: str) -> "FilterValidationError":
         """Create error for invalid numeric filter."""
-        message = ERROR_MESSAGES["NUMERIC_FILTER_INVALID"].format(type_name=type_name)
+        message = cls._NUMERIC_FILTER_INVALID.format(type_name=type_name)
         return cls(message)
 
     @classmethod
     def filter_list_too_large(cls, max_size: int) -> "FilterValidationError":
         """Create error for filter list too large."""
-        message = ERROR_MESSAGES["FILTER_LIST_TOO_LARGE"].format(max_size=max_size)
-        return cls(message)
+        return cls(_format_message("FILTER_LIST_TOO_LARGE", max_size=max_size))
 
 
 class RegexValidationError(ValidationError):
     """Exception raised when regex validation fails."""
 
+    _REGEX_DANGEROUS_CONSTRUCT = ERROR_MESSAGES["REGEX_DANGEROUS_CONSTRUCT"]
+    _REGEX_INVALID_SYNTAX = ERROR_MESSAGES["REGEX_INVALID_SYNTAX"]
+
     @classmethod
     def pattern_too_long(cls, max_length: int) -> "RegexValidationError":
         """Create error for regex pattern too long."""
-        message = ERROR_MESSAGES["REGEX_TOO_LONG"].format(max_length=max_length)
-        return cls(message)
+        return cls(_format_message("REGEX_TOO_LONG", max_length=max_length))
 
     @classmethod
     def dangerous_construct(cls) -> "RegexValidationError":
         """Create error for dangerous regex construct."""
-        return cls(ERROR_MESSAGES["REGEX_DANGEROUS_CONSTRUCT"])
+        return cls(cls._REGEX_DANGEROUS_CONSTRUCT)
 
     @classmethod
     def invalid_syntax(cls, error: str) -> "RegexValidationError":
         """Create error for invalid regex syntax."""
-        message = ERROR_MESSAGES["REGEX_INVALID_SYNTAX"].format(error=error)
+        message = cls._REGEX_INVALID_SYNTAX.format(error=error)
         return cls(message)
@@ -1,29 +1,125 @@
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+import pymongo
 import strawberry
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic_core import to_json
+from pymongo import AsyncMongoClient
+from pymongo.errors import PyMongoError
 from strawberry.fastapi import GraphQLRouter
 
-from satin.config import config
+from satin.config import Config, get_config
+from satin.db import get_client
+from satin.dependencies import get_repo_factory, set_repo_factory
 from satin.middleware.graphql_security import GraphQLSecurityExtension
 from satin.middleware.logging import RequestLoggingMiddleware
 from satin.middleware.rate_limit import RateLimitMiddleware
 from satin.middleware.security import SecurityHeadersMiddleware
+from satin.repositories import RepositoryFactory
 from satin.routers.upload import router as upload_router
 from satin.schema.mutation import Mutation
 from satin.schema.query import Query
 
+logger = logging.getLogger(__name__)
+
 schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[GraphQLSecurityExtension()])
 
 
-def create_app() -> FastAPI:
-    """Create FastAPI application with GraphQL endpoint."""
-    app = FastAPI(title="SATIn API", description="Simple Annotation Tool for Images")
+class GraphQLJSONRouter(GraphQLRouter):
+    """GraphQL router that encodes responses with pydantic-core's Rust JSON encoder."""
+
+    def encode_json(self, data: object) -> bytes:
+        """Encode a GraphQL response payload to JSON bytes."""
+        return to_json(data)
+
+
+# Bounds the startup database calls, so an unreachable MongoDB does not hold up
+# every worker for the driver's 30 second server selection timeout
+STARTUP_DB_TIMEOUT_SECONDS = 5
+
+
+async def _prepare_database(client: AsyncMongoClient | None, repositories: RepositoryFactory) -> None:
+    """Check that MongoDB is reachable and create indexes, without failing startup."""
+    if client is not None:
+        try:
+            await client.admin.command("ping")
+        except PyMongoError:
+            logger.warning("MongoDB is not reachable at startup, connecting on first request instead", exc_info=True)
+            return
+
+    try:
+        # create_indexes is a no-op for indexes that already exist
+        await repositories.ensure_indexes()
+    except PyMongoError:
+        logger.warning("Could not create MongoDB indexes at startup", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up the MongoDB connection pool and create indexes on startup, close the pool on shutdown."""
+    repositories: RepositoryFactory | None = app.state.repositories
+    # Applications given their own repositories never create the shared client
+    client = get_client() if repositories is None else None
+    with pymongo.timeout(STARTUP_DB_TIMEOUT_SECONDS):
+        await _prepare_database(client, get_repo_factory() if repositories is None else repositories)
+
+    yield
+
+    if client is not None:
+        await client.close()
+
+
+# The health payload never changes, so it is serialized once at import time
+HEALTHY_RESPONSE_BODY = b'{"status":"healthy"}'
+
+
+def health_check() -> Response:
+    """Health check endpoint."""
+    return Response(content=HEALTHY_RESPONSE_BODY, media_type="application/json")
+
+
+def _repository_context_getter(
+    repositories: RepositoryFactory | None,
+) -> Callable[[], Awaitable[dict[str, RepositoryFactory]]]:
+    """Build a GraphQL context getter that binds the request's repository factory.
+
+    Each request runs in its own context, so setting the context variable
+    here only affects the resolvers of that request.
+    """
+
+    async def get_context() -> dict[str, RepositoryFactory]:
+        if repositories is not None:
+            set_repo_factory(repositories)
+        return {"repo_factory": get_repo_factory()}
+
+    return get_context
+
+
+def create_app(settings: Config | None = None, repositories: RepositoryFactory | None = None) -> FastAPI:
+    """Create FastAPI application with GraphQL endpoint.
+
+    Args:
+        settings: Configuration to build the application with. Defaults to
+            the shared configuration from get_config().
+        repositories: Repository factory the GraphQL resolvers use for every
+            request. Defaults to the shared factory from satin.dependencies.
+
+    Returns:
+        The configured FastAPI application.
+
+    """
+    config = settings or get_config()
+    app = FastAPI(title="SATIn API", description="Simple Annotation Tool for Images", lifespan=lifespan)
+    app.state.repositories = repositories
 
     # Add security headers middleware first
-    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware, connect_origins=config.cors_origins)
 
     # Add rate limiting middleware
-    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(RateLimitMiddleware, disabled=config.disable_rate_limiting)
 
     # Add request logging middleware
     app.add_middleware(RequestLoggingMiddleware)
@@ -32,6 +128,7 @@ def create_app() -> FastAPI:
     app.add_middleware(
         CORSMiddleware,
         allow_origins=config.cors_origins,  # Use specific origins from config
+        allow_origin_regex=config.cors_origin_regex,  # Compiled once by Starlette
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
         allow_headers=[
@@ -48,19 +145,12 @@ def create_app() -> FastAPI:
         expose_headers=["*"],
     )
 
-    graphql_app = GraphQLRouter(schema)
+    graphql_app = GraphQLJSONRouter(schema, context_getter=_repository_context_getter(repositories))
     app.include_router(graphql_app, prefix="/graphql")
 
     # Add upload router
     app.include_router(upload_router)
 
-    return app
-
+    app.add_api_route("/health", health_check, methods=["GET"])
 
-app = create_app()
-
-
-@app.get("/health")
-def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "healthy"}
+    return app
@@ -1,10 +1,20 @@
 """GraphQL security middleware for depth limiting and query complexity analysis."""
 
 import logging
-from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
-from graphql import GraphQLError
+from graphql import (
+    FieldNode,
+    GraphQLError,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    ValidationContext,
+    ValidationRule,
+    get_nullable_type,
+    is_list_type,
+)
 from strawberry.extensions import SchemaExtension
 
 logger = logging.getLogger(__name__)
@@ -15,130 +25,87 @@ MAX_QUERY_COMPLEXITY = 100
 MAX_ALIASES = 30
 
 
-class QueryDepthAnalysisRule:
-    """Custom depth analysis rule with improved error handling."""
+@lru_cache(maxsize=8)
+def _list_field_names(schema: GraphQLSchema) -> frozenset[str]:
+    """Collect the names of the schema's list fields, computed once per schema.
 
-    def __init__(self, max_depth: int):
-        """Initialize depth analysis rule.
+    A field counts as a list field when its type is a list, or when its name looks
+    like one (plural names, or names containing "list").
+    """
+    names = set()
+    for graphql_type in schema.type_map.values():
+        if not isinstance(graphql_type, GraphQLObjectType | GraphQLInterfaceType):
+            continue
+        for field_name, field in graphql_type.fields.items():
+            if is_list_type(get_nullable_type(field.type)) or field_name.endswith("s") or "list" in field_name.lower():
+                names.add(field_name)
+    return frozenset(names)
 
-        Args:
-            max_depth: Maximum allowed query depth
-
-        """
-        self.max_depth = max_depth
-
-    def __call__(self, validation_context):
-        """Create validation function for GraphQL fields.
-
-        Args:
-            validation_context: GraphQL validation context
-
-        Returns:
-            Dictionary mapping field types to validation functions
-
-        """
-
-        def enter_field(node, _key, _parent, _path, ancestors):
-            # Count selection set ancestors to determine depth
-            depth = len([ancestor for ancestor in ancestors if hasattr(ancestor, "selection_set")])
-            if depth > self.max_depth:
-                validation_context.report_error(
-                    GraphQLError(
-                        f"Query depth of {depth} exceeds maximum allowed depth of {self.max_depth}", nodes=[node]
-                    )
-                )
 
-        return {"Field": enter_field}
+class SecurityAnalysisRule(ValidationRule):
+    """Validation rule checking query depth, complexity and aliases in a single pass.
 
+    The depth is tracked with a counter that is incremented when entering a node
+    with a selection set and decremented when leaving it, so no ancestor list has
+    to be scanned per field.
+    """
 
-class QueryComplexityAnalysisRule:
-    """Analysis rule for query complexity based on field count and nesting."""
+    max_depth = MAX_QUERY_DEPTH
+    max_complexity = MAX_QUERY_COMPLEXITY
+    max_aliases = MAX_ALIASES
 
-    def __init__(self, max_complexity: int):
-        """Initialize complexity analysis rule.
+    def __init__(self, context: ValidationContext) -> None:
+        """Initialize the rule for one validation run.
 
         Args:
-            max_complexity: Maximum allowed query complexity
+            context: GraphQL validation context
 
         """
-        self.max_complexity = max_complexity
-
-    def __call__(self, validation_context):
-        """Create validation function for GraphQL query complexity.
-
-        Args:
-            validation_context: GraphQL validation context
-
-        Returns:
-            Dictionary mapping field types to validation functions
-
-        """
-        complexity = 0
-
-        def enter_field(node, _key, _parent, _path, ancestors):
-            nonlocal complexity
-            # Base complexity of 1 per field
-            field_complexity = 1
-
-            # Add complexity for nested fields
-            depth = len([ancestor for ancestor in ancestors if hasattr(ancestor, "selection_set")])
-            field_complexity += depth * 2
-
-            # Add complexity for list fields (detected by plural names)
-            field_name = node.name.value if hasattr(node, "name") else str(node)
-            if field_name.endswith("s") or "list" in field_name.lower():
-                field_complexity += 5
-
-            complexity += field_complexity
+        super().__init__(context)
+        self.depth = 0
+        self.complexity = 0
+        self.alias_count = 0
+        self.list_field_names = _list_field_names(context.schema)
+
+    def _enter_selection_node(self, *_args: Any) -> None:
+        self.depth += 1
+
+    def _leave_selection_node(self, *_args: Any) -> None:
+        self.depth -= 1
+
+    enter_operation_definition = enter_fragment_definition = enter_inline_fragment = _enter_selection_node
+    leave_operation_definition = leave_fragment_definition = leave_inline_fragment = _leave_selection_node
+    leave_field = _leave_selection_node
+
+    def enter_field(self, node: FieldNode, *_args: Any) -> None:
+        """Check the depth, complexity and alias limits for a field."""
+        depth = self.depth
+        self.depth += 1
+
+        if depth > self.max_depth:
+            self.report_error(
+                GraphQLError(f"Query depth of {depth} exceeds maximum allowed depth of {self.max_depth}", nodes=[node])
+            )
+
+        # Base complexity of 1 per field, more for nested and list fields
+        self.complexity += 1 + depth * 2 + (5 if node.name.value in self.list_field_names else 0)
+        if (complexity := self.complexity) > self.max_complexity:
+            self.report_error(
+                GraphQLError(
+                    f"Query complexity of {complexity} exceeds maximum allowed complexity of {self.max_complexity}",
+                    nodes=[node],
+                )
+            )
 
-            if complexity > self.max_complexity:
-                validation_context.report_error(
+        if node.alias:
+            self.alias_count += 1
+            if self.alias_count > self.max_aliases:
+                self.report_error(
                     GraphQLError(
-                        f"Query complexity of {complexity} exceeds maximum allowed complexity of {self.max_complexity}",
-                        nodes=[node],
+                        f"Query uses {self.alias_count} aliases, exceeding maximum of {self.max_aliases}", nodes=[node]
                     )
                 )
 
-        return {"Field": enter_field}
-
-
-class AliasAnalysisRule:
-    """Analysis rule to prevent alias-based DoS attacks."""
-
-    def __init__(self, max_aliases: int):
-        """Initialize alias analysis rule.
-
-        Args:
-            max_aliases: Maximum allowed aliases in a query
-
-        """
-        self.max_aliases = max_aliases
-
-    def __call__(self, validation_context):
-        """Create validation function for GraphQL aliases.
-
-        Args:
-            validation_context: GraphQL validation context
-
-        Returns:
-            Dictionary mapping field types to validation functions
-
-        """
-        alias_count = 0
-
-        def enter_field(node, _key, _parent, _path, _ancestors):
-            nonlocal alias_count
-            if hasattr(node, "alias") and node.alias:
-                alias_count += 1
-                if alias_count > self.max_aliases:
-                    validation_context.report_error(
-                        GraphQLError(
-                            f"Query uses {alias_count} aliases, exceeding maximum of {self.max_aliases}", nodes=[node]
-                        )
-                    )
-
-        return {"Field": enter_field}
-
 
 class GraphQLSecurityExtension(SchemaExtension):
     """Strawberry extension for GraphQL security validation."""
@@ -171,10 +138,12 @@ def get_security_validation_rules(
     max_depth: int = MAX_QUERY_DEPTH,
     max_complexity: int = MAX_QUERY_COMPLEXITY,
     max_aliases: int = MAX_ALIASES,
-) -> list[Callable[[Any], Any]]:
+) -> list[type[ValidationRule]]:
     """Get a list of security validation rules for GraphQL."""
     return [
-        QueryDepthAnalysisRule(max_depth),
-        QueryComplexityAnalysisRule(max_complexity),
-        AliasAnalysisRule(max_aliases),
+        type(
+            "SecurityAnalysisRule",
+            (SecurityAnalysisRule,),
+            {"max_depth": max_depth, "max_complexity": max_complexity, "max_aliases": max_aliases},
+        )
     ]
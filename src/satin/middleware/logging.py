@@ -1,29 +1,57 @@
 import logging
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log requests and responses with timing information."""
+class RequestLoggingMiddleware:
+    """Middleware to log requests and responses with timing information.
 
-    async def dispatch(self, request: Request, call_next):
+    Implemented as a pure ASGI middleware, so the response is passed through
+    to the client without being re-streamed by ``BaseHTTPMiddleware``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the request logging middleware.
+
+        Args:
+            app: The ASGI application
+
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and log timing information."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
+        method = scope["method"]
+
+        # Log request, building the URL only when it is going to be logged
+        log_info = logger.isEnabledFor(logging.INFO)
+        url = URL(scope=scope) if log_info else None
+        if log_info:
+            logger.info("Request: %s %s", method, url)
 
-        # Log request
-        logger.info("Request: %s %s", request.method, request.url)
+        status_code = 500
 
-        response = await call_next(request)
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
 
         # Log response with timing
         process_time = time.time() - start_time
-        logger.info("Response: %d - %.4fs", response.status_code, process_time)
+        if log_info:
+            logger.info("Response: %d - %.4fs", status_code, process_time)
 
         if process_time > 1.0:  # Log slow requests
-            logger.warning("Slow request: %s %s took %.4fs", request.method, request.url, process_time)
-
-        return response
+            logger.warning("Slow request: %s %s took %.4fs", method, url or URL(scope=scope), process_time)
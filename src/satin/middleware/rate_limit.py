@@ -1,16 +1,16 @@
 """Rate limiting middleware for FastAPI and GraphQL endpoints."""
 
-import json
 import logging
 import time
-from collections import defaultdict
-from collections.abc import Awaitable, Callable
+from collections import deque
 
-from fastapi import Request, Response
+from fastapi import Request
+from pydantic_core import from_json, to_json
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from satin.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -21,40 +21,35 @@ class InMemoryRateLimitStore:
 
     def __init__(self):
         """Initialize the in-memory rate limit store."""
-        self._store: dict[str, dict[str, tuple[int, float]]] = defaultdict(dict)
+        # key -> (count, window start, window duration); only the current window is kept
+        self._store: dict[str, tuple[int, float, int]] = {}
 
     def get(self, key: str) -> int:
         """Get current count for a key."""
-        now = time.time()
-        if key in self._store:
-            for window_key, (_count, timestamp) in list(self._store[key].items()):
-                # Clean up expired windows
-                window_duration = int(window_key.split(":")[1])
-                if now - timestamp > window_duration:
-                    del self._store[key][window_key]
-
-            if self._store[key]:
-                return sum(count for count, _ in self._store[key].values())
-        return 0
+        entry = self._store.get(key)
+        if entry is None:
+            return 0
+        count, window_start, window = entry
+        if time.time() - window_start >= window:
+            del self._store[key]
+            return 0
+        return count
 
     def incr(self, key: str, window: int = 60, amount: int = 1) -> int:
         """Increment counter for a key within a time window."""
         now = time.time()
-        window_key = f"{int(now // window) * window}:{window}"
-
-        if window_key not in self._store[key]:
-            self._store[key][window_key] = (0, now)
+        count, window_start, _ = self._store.get(key, (0, now, window))
+        if now - window_start >= window:
+            # The previous window is over, start a new one
+            count, window_start = 0, now
 
-        count, timestamp = self._store[key][window_key]
-        self._store[key][window_key] = (count + amount, timestamp)
-
-        result = self.get(key)
-        return result if result is not None else 0
+        count += amount
+        self._store[key] = (count, window_start, window)
+        return count
 
     def reset(self, key: str) -> None:
         """Reset counter for a key."""
-        if key in self._store:
-            del self._store[key]
+        self._store.pop(key, None)
 
 
 # Global rate limit store
@@ -68,12 +63,7 @@ def _is_rate_limiting_disabled() -> bool:
         True if rate limiting should be disabled
 
     """
-    try:
-        from satin.config import config  # noqa: PLC0415
-    except ImportError:
-        return False
-    else:
-        return config.disable_rate_limiting
+    return get_config().disable_rate_limiting
 
 
 def get_client_identifier(request: Request) -> str:
@@ -87,6 +77,21 @@ def is_graphql_request(request: Request) -> bool:
     return bool(request.url.path.startswith("/graphql"))
 
 
+# The top-level "query" string of a GraphQL JSON body, matched without parsing the
+# rest of the body (variables can be much larger than the query itself)
+def extract_graphql_query(body: bytes) -> str:
+    """Extract the query string from a GraphQL JSON request body.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+
+    """
+    data = from_json(body)
+    # Only the top-level query is executed, so only that one is scored
+    query = data.get("query") if isinstance(data, dict) else None
+    return query if isinstance(query, str) else ""
+
+
 def get_query_complexity_score(query: str) -> int:
     """Estimate GraphQL query complexity for rate limiting."""
     if not query:
@@ -102,19 +107,77 @@ def get_query_complexity_score(query: str) -> int:
     # Count field selections
     complexity += query.count("\n") // 2
 
+    # Lowercase once for both keyword checks
+    lowered_query = query.lower()
+
     # Higher cost for mutations
-    if "mutation" in query.lower():
+    if "mutation" in lowered_query:
         complexity += 5
 
     # Higher cost for subscriptions
-    if "subscription" in query.lower():
+    if "subscription" in lowered_query:
         complexity += 10
 
     return min(complexity, 100)  # Cap at 100
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Custom rate limiting middleware with GraphQL-aware features."""
+async def _receive_body(receive: Receive) -> tuple[bytes, list[Message]]:
+    """Read the request body straight from the ASGI messages, keeping them for replay."""
+    messages: list[Message] = []
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request" or not message.get("more_body", False):
+            break
+
+    chunks = [message.get("body", b"") for message in messages if message["type"] == "http.request"]
+    # The body usually arrives in a single message, which needs no copy
+    body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    return body, messages
+
+
+def _replay_messages(messages: list[Message], receive: Receive) -> Receive:
+    """Wrap receive so the downstream app gets the already received messages first."""
+    pending = deque(messages)
+
+    async def replay_receive() -> Message:
+        if pending:
+            return pending.popleft()
+        return await receive()
+
+    return replay_receive
+
+
+# Paths that are never rate limited (health checks and API docs)
+_SKIP_PATHS = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
+
+# Headers shared by every rate limit response, encoded once
+_RATE_LIMIT_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"retry-after", b"60"),
+    (b"x-ratelimit-exceeded", b"true"),
+]
+
+
+async def _send_rate_limit_response(send: Send, message: str) -> None:
+    """Send a rate limit exceeded response directly over ASGI."""
+    body = to_json({"error": "Rate limit exceeded", "message": message})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [*_RATE_LIMIT_HEADERS, (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """Custom rate limiting middleware with GraphQL-aware features.
+
+    Implemented as a pure ASGI middleware so requests are not wrapped in the
+    extra task group and response streaming of ``BaseHTTPMiddleware``.
+    """
 
     def __init__(
         self,
@@ -123,6 +186,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         graphql_limit: int = 1000,  # GraphQL requests per minute
         burst_limit: int = 1000,  # requests per 10 seconds
         complexity_limit: int = 10000,  # complexity points per minute
+        *,
+        disabled: bool | None = None,
     ):
         """Initialize rate limiting middleware.
 
@@ -132,9 +197,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             graphql_limit: GraphQL requests per minute
             burst_limit: Requests per 10 seconds (burst protection)
             complexity_limit: Complexity points per minute for GraphQL
+            disabled: Whether to pass all requests through without limits,
+                defaults to the configured disable_rate_limiting setting
 
         """
-        super().__init__(app)
+        self.app = app
+        # Resolved once here instead of on every request
+        self.disabled = _is_rate_limiting_disabled() if disabled is None else disabled
         self.default_limit = default_limit
         self.graphql_limit = graphql_limit
         self.burst_limit = burst_limit
@@ -149,7 +218,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             msg = f"Default rate limit exceeded: {count}/{self.default_limit} per minute"
             raise ValueError(msg)
 
-    async def _handle_graphql_rate_limit(self, request: Request, client_id: str) -> None:
+    async def _handle_graphql_rate_limit(self, body: bytes, client_id: str) -> None:
         """Handle rate limiting for GraphQL requests with complexity awareness."""
         # Basic GraphQL request count
         graphql_key = f"{client_id}:graphql"
@@ -160,51 +229,42 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             raise ValueError(msg)
 
         # Complexity-based rate limiting
+        if not body:
+            return
         try:
-            body = await request.body()
-            if body:
-                data = json.loads(body)
-                query = data.get("query", "")
-
-                if query:
-                    complexity = get_query_complexity_score(query)
-                    complexity_key = f"{client_id}:complexity"
-                    total_complexity = rate_limit_store.incr(complexity_key, window=60, amount=complexity)
-
-                    if total_complexity > self.complexity_limit:
-                        msg = (
-                            f"GraphQL complexity limit exceeded: {total_complexity}/{self.complexity_limit} "
-                            "points per minute"
-                        )
-                        raise ValueError(msg)
-
-                    logger.debug(
-                        "GraphQL query complexity for %s: %d (total: %d)", client_id, complexity, total_complexity
-                    )
-
-        except (json.JSONDecodeError, KeyError):
+            query = extract_graphql_query(body)
+        except ValueError:
             # If we can't parse the request, apply default limits
             logger.debug("Could not parse GraphQL request for complexity analysis")
+            return
 
-    def _create_rate_limit_response(self, message: str) -> Response:
-        """Create a rate limit exceeded response."""
-        return Response(
-            content=f'{{"error": "Rate limit exceeded", "message": "{message}"}}',
-            status_code=429,
-            headers={"Content-Type": "application/json", "Retry-After": "60", "X-RateLimit-Exceeded": "true"},
-        )
+        if query:
+            complexity = get_query_complexity_score(query)
+            complexity_key = f"{client_id}:complexity"
+            total_complexity = rate_limit_store.incr(complexity_key, window=60, amount=complexity)
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        """Apply rate limiting to requests."""
-        # Skip rate limiting if disabled (e.g., during testing)
-        if _is_rate_limiting_disabled():
-            return await call_next(request)
+            if total_complexity > self.complexity_limit:
+                msg = f"GraphQL complexity limit exceeded: {total_complexity}/{self.complexity_limit} points per minute"
+                raise ValueError(msg)
 
-        client_id = get_client_identifier(request)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("GraphQL query complexity for %s: %d (total: %d)", client_id, complexity, total_complexity)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Apply rate limiting to HTTP requests."""
+        # Skip rate limiting if disabled (e.g., during testing)
+        if scope["type"] != "http" or self.disabled:
+            await self.app(scope, receive, send)
+            return
 
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
+        if scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        client_id = get_client_identifier(request)
+        received: list[Message] | None = None
 
         try:
             # Apply burst protection (short-term limit)
@@ -213,24 +273,26 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             if burst_count > self.burst_limit:
                 logger.warning("Burst rate limit exceeded for %s: %d/%d", client_id, burst_count, self.burst_limit)
                 msg = f"Too many requests in short timeframe: {burst_count}/{self.burst_limit} per 10 seconds"
-                return self._create_rate_limit_response(msg)
+                await _send_rate_limit_response(send, msg)
+                return
 
             # Apply different limits based on request type
             if is_graphql_request(request):
-                await self._handle_graphql_rate_limit(request, client_id)
+                body, received = await _receive_body(receive)
+                await self._handle_graphql_rate_limit(body, client_id)
             else:
                 await self._handle_default_rate_limit(request, client_id)
 
-            # Process the request
-            return await call_next(request)
-
         except ValueError as e:
             logger.warning("Rate limit exceeded for %s: %s", client_id, e)
-            return self._create_rate_limit_response(str(e))
+            await _send_rate_limit_response(send, str(e))
+            return
         except Exception:
-            logger.exception("Rate limiting error for %s", client_id)
             # Don't block requests on rate limiting errors
-            return await call_next(request)
+            logger.exception("Rate limiting error for %s", client_id)
+
+        # Process the request, handing it the body messages if they were already read
+        await self.app(scope, receive if received is None else _replay_messages(received, receive), send)
 
 
 def create_limiter() -> Limiter:
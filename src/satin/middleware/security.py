@@ -1,53 +1,79 @@
 """Security middleware for FastAPI application."""
 
+import base64
 import secrets
-from collections.abc import Awaitable, Callable
+from collections.abc import Sequence
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from satin.config import config
+from satin.config import get_config
 
+# Paths served without security headers (health checks and API docs)
+SKIP_PATHS = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
+# Raw ASGI header tuples, shared by all middlewares and appended as-is to every response
+STATIC_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-frame-options", b"DENY"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    # Additional hardening headers
+    (b"x-permitted-cross-domain-policies", b"none"),
+    (b"cross-origin-embedder-policy", b"require-corp"),
+    (b"cross-origin-opener-policy", b"same-origin"),
+    (b"cross-origin-resource-policy", b"same-origin"),
+)
 
-    def __init__(self, app: ASGIApp, nonce_enabled: bool = False) -> None:
+HSTS_HEADER = (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+
+# Placeholder marking where the per-request nonce goes in the CSP template
+_NONCE_SLOT = "{nonce}"
+
+
+class SecurityHeadersMiddleware:
+    """Middleware to add security headers to all responses.
+
+    Implemented as a pure ASGI middleware: pre-encoded header tuples are
+    appended to the ``http.response.start`` message, and everything that does
+    not depend on the request is built once when the middleware is created.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        nonce_enabled: bool = False,
+        connect_origins: Sequence[str] | None = None,
+    ) -> None:
         """Initialize the security middleware.
 
         Args:
             app: The ASGI application
             nonce_enabled: Whether to generate nonces for CSP
+            connect_origins: Origins allowed in the CSP connect-src directive,
+                defaults to the configured CORS origins
 
         """
-        super().__init__(app)
+        self.app = app
         self.nonce_enabled = nonce_enabled
-
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        """Add security headers to the response."""
-        # Generate a nonce for this request if enabled
-        nonce = secrets.token_urlsafe(16) if self.nonce_enabled else None
-
-        # Store nonce in request state for template usage
-        if nonce:
-            request.state.csp_nonce = nonce
-
-        response = await call_next(request)
-
-        # Skip security headers for health checks and static files
-        if request.url.path in ["/health", "/docs", "/redoc", "/openapi.json"]:
-            return response
-
-        # Content Security Policy
+        self.connect_origins = list(get_config().cors_origins if connect_origins is None else connect_origins)
+        # Without nonces the policy is the same for every request, with nonces
+        # only the nonce has to be spliced between the two halves of the policy
+        csp_prefix, _, csp_suffix = self._build_csp(_NONCE_SLOT if nonce_enabled else None).partition(_NONCE_SLOT)
+        self.csp_prefix = csp_prefix.encode()
+        self.csp_suffix = csp_suffix.encode()
+        self.security_headers = [(b"content-security-policy", self.csp_prefix), *STATIC_SECURITY_HEADERS]
+        self.https_security_headers = [*self.security_headers, HSTS_HEADER]
+
+    def _build_csp(self, nonce: str | None) -> str:
+        """Build the Content Security Policy header value."""
         csp_directives = [
             "default-src 'self'",
             "script-src 'self'" + (f" 'nonce-{nonce}'" if nonce else " 'unsafe-inline'"),
             "style-src 'self' 'unsafe-inline'",  # Allow inline styles for API docs
             "img-src 'self' data: https: blob:",
             "font-src 'self' data:",
-            f"connect-src 'self' {' '.join(config.cors_origins)}",
+            " ".join(["connect-src 'self'", *self.connect_origins]),
             "frame-src 'none'",
             "object-src 'none'",
             "base-uri 'self'",
@@ -55,24 +81,39 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "frame-ancestors 'none'",
             "upgrade-insecure-requests",
         ]
+        return "; ".join(csp_directives)
 
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Additional security headers
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        # Generate a nonce for this request if enabled, as bytes for the CSP header
+        nonce = base64.urlsafe_b64encode(secrets.token_bytes(16)).rstrip(b"=") if self.nonce_enabled else None
 
-        # HSTS header (only for HTTPS)
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        # Store nonce in request state for template usage
+        if nonce:
+            scope.setdefault("state", {})["csp_nonce"] = nonce.decode("ascii")
 
-        # Additional hardening headers
-        response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
-        response.headers["Cross-Origin-Embedder-Policy"] = "require-corp"
-        response.headers["Cross-Origin-Opener-Policy"] = "same-origin"
-        response.headers["Cross-Origin-Resource-Policy"] = "same-origin"
+        # Skip security headers for health checks and static files
+        if scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        # HSTS header (only for HTTPS)
+        is_https = scope.get("scheme") == "https"
+        if nonce is None:
+            security_headers = self.https_security_headers if is_https else self.security_headers
+        else:
+            csp = self.csp_prefix + nonce + self.csp_suffix
+            security_headers = [(b"content-security-policy", csp), *STATIC_SECURITY_HEADERS]
+            if is_https:
+                security_headers.append(HSTS_HEADER)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *security_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,15 +1,16 @@
 """Pydantic models for Annotation and BBox."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from satin.constants import MAX_BBOX_COORDINATE
-from satin.exceptions import CoordinateValidationError
 from satin.validators import sanitize_string, validate_tags
 
 
 class Annotation(BaseModel):
     """Annotation model for image annotations."""
 
+    model_config = ConfigDict(frozen=True)
+
     text: str | None = Field(default=None, description="Text annotation", max_length=1000)
     tags: list[str] | None = Field(default=None, description="List of tags", max_length=50)
 
@@ -37,22 +38,14 @@ class Annotation(BaseModel):
 class BBox(BaseModel):
     """Bounding box model with annotation."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: float = Field(..., description="X coordinate of the bounding box", ge=0, le=MAX_BBOX_COORDINATE)
     y: float = Field(..., description="Y coordinate of the bounding box", ge=0, le=MAX_BBOX_COORDINATE)
     width: float = Field(..., description="Width of the bounding box", gt=0, le=MAX_BBOX_COORDINATE)
     height: float = Field(..., description="Height of the bounding box", gt=0, le=MAX_BBOX_COORDINATE)
     annotation: Annotation = Field(..., description="Annotation for the bounding box")
 
-    @field_validator("x", "y", "width", "height")
-    @classmethod
-    def validate_coordinates(cls, v: float, info) -> float:
-        """Validate bounding box coordinates."""
-        if v < 0:
-            raise CoordinateValidationError.negative_coordinate(info.field_name)
-        if v > MAX_BBOX_COORDINATE:
-            raise CoordinateValidationError.exceeds_maximum(info.field_name, MAX_BBOX_COORDINATE)
-        return v
-
     def __str__(self) -> str:
         """Get string representation of the BBox."""
         return f"BBox(x={self.x}, y={self.y}, width={self.width}, height={self.height}, annotation={self.annotation})"
@@ -1,23 +1,23 @@
 """Pydantic models for filter and query types."""
 
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from satin.constants import MAX_FILTER_LIST_SIZE, MAX_FILTERS_PER_TYPE, MAX_QUERY_LIMIT
 from satin.exceptions import FilterValidationError
 from satin.validators import sanitize_string, validate_field_name
 
 
-class SortDirection(Enum):
+class SortDirection(StrEnum):
     """Sort direction for query results."""
 
     ASC = "asc"
     DESC = "desc"
 
 
-class NumberFilterOperator(Enum):
+class NumberFilterOperator(StrEnum):
     """Filter operators for numeric fields."""
 
     EQ = "eq"  # Equal
@@ -30,7 +30,7 @@ class NumberFilterOperator(Enum):
     NIN = "nin"  # Not in list
 
 
-class StringFilterOperator(Enum):
+class StringFilterOperator(StrEnum):
     """Filter operators for string fields."""
 
     EQ = "eq"  # Equal
@@ -43,7 +43,7 @@ class StringFilterOperator(Enum):
     NIN = "nin"  # Not in list
 
 
-class ListFilterOperator(Enum):
+class ListFilterOperator(StrEnum):
     """Filter operators for list/array fields."""
 
     CONTAINS = "contains"  # List contains value
@@ -54,9 +54,17 @@ class ListFilterOperator(Enum):
     SIZE_LT = "size_lt"  # List size less than
 
 
+# Operators that take a list of values
+NUMBER_LIST_OPERATORS = frozenset({NumberFilterOperator.IN, NumberFilterOperator.NIN})
+STRING_LIST_OPERATORS = frozenset({StringFilterOperator.IN, StringFilterOperator.NIN})
+LIST_LIST_OPERATORS = frozenset({ListFilterOperator.CONTAINS_ALL, ListFilterOperator.CONTAINS_ANY})
+
+
 class SortModel(BaseModel):
     """Sort specification for a field."""
 
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="Field name to sort by")
     direction: SortDirection = Field(default=SortDirection.ASC, description="Sort direction")
 
@@ -70,6 +78,8 @@ class SortModel(BaseModel):
 class NumberFilterModel(BaseModel):
     """Filter specification for numeric fields."""
 
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="Field name to filter")
     operator: NumberFilterOperator = Field(..., description="Filter operator")
     value: int | float | list[int | float] = Field(..., description="Filter value(s)")
@@ -84,20 +94,16 @@ class NumberFilterModel(BaseModel):
     @classmethod
     def validate_value(cls, v: float | list[int | float], info: Any) -> int | float | list[int | float]:
         """Validate filter value based on operator."""
-        # Get the operator from the field info
-        operator = info.data.get("operator") if hasattr(info, "data") else None
+        # The operator is validated before the value, so it is in info.data unless it was invalid
+        operator = info.data.get("operator")
 
         # Handle list operators (IN, NIN)
-        if operator in {NumberFilterOperator.IN, NumberFilterOperator.NIN}:
+        if operator in NUMBER_LIST_OPERATORS:
             if not isinstance(v, list):
                 v = [v]
 
-            # Validate each item is numeric
-            for item in v:
-                if not isinstance(item, (int, float)):
-                    raise FilterValidationError.numeric_filter_invalid(type(item).__name__)
-
-            # Limit list size to prevent DoS
+            # Limit list size to prevent DoS, the items themselves are
+            # already validated as numbers by the field type
             if len(v) > MAX_FILTER_LIST_SIZE:
                 raise FilterValidationError.filter_list_too_large(MAX_FILTER_LIST_SIZE)
 
@@ -114,6 +120,8 @@ class NumberFilterModel(BaseModel):
 class StringFilterModel(BaseModel):
     """Filter specification for string fields."""
 
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="Field name to filter")
     operator: StringFilterOperator = Field(..., description="Filter operator")
     value: str | list[str] = Field(..., description="Filter value(s)")
@@ -128,11 +136,11 @@ class StringFilterModel(BaseModel):
     @classmethod
     def validate_value(cls, v: str | list[str], info: Any) -> str | list[str]:
         """Validate and sanitize filter value based on operator."""
-        # Get the operator from the field info
-        operator = info.data.get("operator") if hasattr(info, "data") else None
+        # The operator is validated before the value, so it is in info.data unless it was invalid
+        operator = info.data.get("operator")
 
         # Handle list operators (IN, NIN)
-        if operator in {StringFilterOperator.IN, StringFilterOperator.NIN}:
+        if operator in STRING_LIST_OPERATORS:
             if not isinstance(v, list):
                 v = [v]
 
@@ -140,7 +148,12 @@ class StringFilterModel(BaseModel):
             if len(v) > MAX_FILTER_LIST_SIZE:
                 raise FilterValidationError.filter_list_too_large(MAX_FILTER_LIST_SIZE)
 
-            return [sanitize_string(str(item), max_length=1000) for item in v]
+            # Values often repeat within one filter, so each distinct value is sanitized once
+            sanitized: dict[str, str] = {}
+            for item in map(str, v):
+                if item not in sanitized:
+                    sanitized[item] = sanitize_string(item, max_length=1000)
+            return [sanitized[item] for item in map(str, v)]
 
         # Handle single value operators
         if isinstance(v, list):
@@ -151,6 +164,8 @@ class StringFilterModel(BaseModel):
 class ListFilterModel(BaseModel):
     """Filter specification for list/array fields."""
 
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="Field name to filter")
     operator: ListFilterOperator = Field(..., description="Filter operator")
     value: Any | list[Any] = Field(..., description="Filter value(s)")
@@ -165,11 +180,11 @@ class ListFilterModel(BaseModel):
     @classmethod
     def validate_value(cls, v: Any, info: Any) -> Any:
         """Validate filter value based on operator."""
-        # Get the operator from the field info
-        operator = info.data.get("operator") if hasattr(info, "data") else None
+        # The operator is validated before the value, so it is in info.data unless it was invalid
+        operator = info.data.get("operator")
 
         # Handle list operators (CONTAINS_ALL, CONTAINS_ANY)
-        if operator in {ListFilterOperator.CONTAINS_ALL, ListFilterOperator.CONTAINS_ANY}:
+        if operator in LIST_LIST_OPERATORS:
             if not isinstance(v, list):
                 v = [v]
 
@@ -1,13 +1,16 @@
 """Pydantic model for Image."""
 
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ImageDimensions(BaseModel):
     """Image dimensions model."""
 
+    model_config = ConfigDict(frozen=True)
+
     width: int = Field(..., description="Image width in pixels")
     height: int = Field(..., description="Image height in pixels")
 
@@ -19,7 +22,7 @@ class ImageMetadata(BaseModel):
     size: int = Field(..., description="File size in bytes")
     mime_type: str = Field(..., description="MIME type of the image")
     format: str | None = Field(None, description="Image format (JPEG, PNG, etc.)")
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow, description="Upload timestamp")
+    uploaded_at: datetime = Field(default_factory=partial(datetime.now, UTC), description="Upload timestamp")
     is_uploaded: bool = Field(default=False, description="Whether image was uploaded vs URL")
 
 
@@ -1,7 +1,8 @@
 """Pydantic models for Task."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import StrEnum
+from functools import partial
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -30,7 +31,7 @@ class Task(BaseModel):
         default_factory=list, description="List of bounding boxes", max_length=MAX_BBOXES_PER_TASK
     )
     status: TaskStatus = Field(default=TaskStatus.DRAFT, description="Status of the task")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=partial(datetime.now, UTC), description="Creation timestamp")
 
     @field_validator("bboxes")
     @classmethod
@@ -1,4 +1,4 @@
-import asyncio
+import inspect
 import time
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar
@@ -20,6 +20,8 @@ class BaseRepository[T](ABC):
         self.db = db
         self.collection_name = collection_name
         self.collection = db[collection_name]
+        # The driver's aggregate is a coroutine function, test doubles return the cursor directly
+        self._aggregate_returns_coroutine = inspect.iscoroutinefunction(self.collection.aggregate)
         # Simple in-memory cache for single-user application
         self._cache: dict[str, tuple[Any, float]] = {}  # key -> (value, timestamp)
         self._cache_ttl = 300  # 5 minutes TTL
@@ -83,14 +85,16 @@ class BaseRepository[T](ABC):
             if not isinstance(cached_result, dict):
                 msg = "Cached result is not a valid document"
                 raise TypeError(msg)
-            return cached_result
+            # Callers convert the document in place, so hand out a copy
+            return dict(cached_result)
 
         try:
             validated_id = validate_and_convert_object_id(object_id)
             result = await self.collection.find_one({"_id": validated_id})
 
-            # Cache the result
-            self._set_cache(cache_key, result)
+            # Cache a copy of the result, callers convert the document in place
+            if result is not None:
+                self._set_cache(cache_key, dict(result))
         except ValidationError:
             # Return None for invalid IDs instead of raising an error
             # This maintains backward compatibility while preventing injection
@@ -143,11 +147,28 @@ class BaseRepository[T](ABC):
 
         sort_dict = {}
         for sort_input in query_input.sorts:
-            field, direction = build_mongodb_sort_condition(sort_input.field, sort_input.direction.value)
+            field, direction = build_mongodb_sort_condition(sort_input.field, sort_input.direction)
             sort_dict[field] = direction
 
         return sort_dict
 
+    async def aggregate_to_list(
+        self, pipeline: list[dict[str, Any]], batch_size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Run an aggregation pipeline and fetch all resulting documents in batches.
+
+        Passing the expected number of results as batch_size fetches them in
+        a single batch instead of a default sized first batch and a getMore.
+        """
+        opt_cursor = (
+            self.collection.aggregate(pipeline, batchSize=batch_size)
+            if batch_size
+            else self.collection.aggregate(pipeline)
+        )
+        cursor = await opt_cursor if self._aggregate_returns_coroutine else opt_cursor
+
+        return await cursor.to_list(None)
+
     async def find_all(
         self,
         limit: int | None = None,
@@ -169,41 +190,14 @@ class BaseRepository[T](ABC):
 
         # Use query_input pagination if provided, otherwise use parameters
         if query_input:
-            pipeline.extend(
-                [
-                    {"$skip": query_input.offset},
-                    {"$limit": query_input.limit if query_input.limit else 1000},
-                ]
-            )
+            page_offset, page_limit = query_input.offset, query_input.limit or 1000
         else:
-            pipeline.extend(
-                [
-                    {"$skip": offset},
-                    {"$limit": limit if limit is not None else 1000},
-                ]
-            )
-
-        # Add ID conversion
-        pipeline.append(
-            {
-                "$addFields": {
-                    "id": {"$toString": "$_id"},
-                }
-            }
-        )
-
-        results: list[dict[str, Any]] = []
-        opt_cursor = self.collection.aggregate(pipeline)
-        if asyncio.iscoroutine(opt_cursor):
-            cursor = await opt_cursor
-        else:
-            cursor = opt_cursor  # Handle sync cursor for testing
-
-        async for document in cursor:
-            document.pop("_id", None)
-            results.append(document)
+            page_offset, page_limit = offset, limit if limit is not None else 1000
+        pipeline.extend([{"$skip": page_offset}, {"$limit": page_limit}])
 
-        return results
+        # IDs are converted here rather than with a $toString stage run by the server for every document
+        results = await self.aggregate_to_list(pipeline, batch_size=page_limit)
+        return [self._convert_id(document) for document in results]
 
     async def count_all(self, filter_query: dict[str, Any] | None = None, query_input=None) -> int:  # QueryModel | None
         """Count total documents in the collection."""
@@ -9,29 +9,12 @@ class RepositoryFactory:
     """Factory for creating repository instances with shared database connection."""
 
     def __init__(self, db: AsyncDatabase):
-        """Initialize the factory with a database connection."""
+        """Initialize the factory and its repositories with a database connection."""
         self.db = db
-        self._project_repo: ProjectRepository | None = None
-        self._image_repo: ImageRepository | None = None
-        self._task_repo: TaskRepository | None = None
+        self.project_repo = ProjectRepository(db)
+        self.image_repo = ImageRepository(db)
+        self.task_repo = TaskRepository(db, image_repo=self.image_repo, project_repo=self.project_repo)
 
-    @property
-    def project_repo(self) -> ProjectRepository:
-        """Get or create ProjectRepository instance."""
-        if self._project_repo is None:
-            self._project_repo = ProjectRepository(self.db)
-        return self._project_repo
-
-    @property
-    def image_repo(self) -> ImageRepository:
-        """Get or create ImageRepository instance."""
-        if self._image_repo is None:
-            self._image_repo = ImageRepository(self.db)
-        return self._image_repo
-
-    @property
-    def task_repo(self) -> TaskRepository:
-        """Get or create TaskRepository instance."""
-        if self._task_repo is None:
-            self._task_repo = TaskRepository(self.db)
-        return self._task_repo
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the repositories' queries rely on."""
+        await self.task_repo.ensure_indexes()
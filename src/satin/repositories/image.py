@@ -3,11 +3,27 @@ from typing import Any
 import strawberry
 from pymongo.asynchronous.database import AsyncDatabase
 
-from satin.models.image import Image
+from satin.models.image import Image, ImageDimensions, ImageMetadata
 
 from .base import BaseRepository
 
 
+def image_from_document(data: dict[str, Any]) -> Image:
+    """Build an Image from a stored image document without re-validating it.
+
+    Images are validated when they are created, so reads only rebuild the
+    nested models. The document must already carry its string id.
+    """
+    dimensions = data.get("dimensions")
+    metadata = data.get("metadata")
+    return Image.model_construct(
+        id=data["id"],
+        url=data["url"],
+        dimensions=ImageDimensions.model_construct(**dimensions) if dimensions else None,
+        metadata=ImageMetadata.model_construct(**metadata) if metadata else None,
+    )
+
+
 class ImageRepository(BaseRepository[Image]):
     """Repository for Image domain objects."""
 
@@ -17,8 +33,7 @@ class ImageRepository(BaseRepository[Image]):
 
     async def to_domain_object(self, data: dict[str, Any]) -> Image:
         """Convert database document to Image domain object."""
-        data = self._convert_id(data)
-        return Image(**data)
+        return image_from_document(self._convert_id(data))
 
     async def get_image(self, image_id: strawberry.ID) -> Image | None:
         """Fetch an image by its ID from the database."""
@@ -34,8 +49,10 @@ class ImageRepository(BaseRepository[Image]):
         query_input=None,  # QueryModel | None
     ) -> list[Image]:
         """Fetch paginated images using MongoDB aggregation pipeline."""
-        results_data = await self.find_all(limit=limit, offset=offset, query_input=query_input)
-        return [await self.to_domain_object(data) for data in results_data]
+        return [
+            await self.to_domain_object(data)
+            for data in await self.find_all(limit=limit, offset=offset, query_input=query_input)
+        ]
 
     async def create_image(self, url: str, metadata: dict[str, Any] | None = None) -> Image:
         """Create a new image in the database."""
@@ -43,15 +60,12 @@ class ImageRepository(BaseRepository[Image]):
         if metadata:
             image_data.update(metadata)
         created_data = await self.create(image_data)
-        return await self.to_domain_object(created_data)
+        # Validate once on the way in, reads then trust the stored document
+        return Image(**created_data)
 
     async def update_image(self, image_id: strawberry.ID, url: str | None = None) -> bool:
         """Update an image in the database."""
-        update_data = {}
-        if url is not None:
-            update_data["url"] = url
-
-        return await self.update_by_id(image_id, update_data)
+        return await self.update_by_id(image_id, {"url": url} if url is not None else {})
 
     async def delete_image(self, image_id: strawberry.ID) -> bool:
         """Delete an image from the database."""
@@ -34,8 +34,10 @@ class ProjectRepository(BaseRepository[Project]):
         query_input=None,  # QueryModel | None
     ) -> list[Project]:
         """Fetch paginated projects using MongoDB aggregation pipeline."""
-        results_data = await self.find_all(limit=limit, offset=offset, query_input=query_input)
-        return [await self.to_domain_object(data) for data in results_data]
+        return [
+            await self.to_domain_object(data)
+            for data in await self.find_all(limit=limit, offset=offset, query_input=query_input)
+        ]
 
     async def create_project(self, name: str, description: str) -> Project:
         """Create a new project in the database."""
@@ -47,11 +49,9 @@ class ProjectRepository(BaseRepository[Project]):
         self, project_id: strawberry.ID, name: str | None = None, description: str | None = None
     ) -> bool:
         """Update a project in the database."""
-        update_data = {}
-        if name is not None:
-            update_data["name"] = name
-        if description is not None:
-            update_data["description"] = description
+        update_data = {
+            key: value for key, value in (("name", name), ("description", description)) if value is not None
+        }
 
         # If no fields to update, consider it successful (idempotent operation)
         if not update_data:
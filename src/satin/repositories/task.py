@@ -1,22 +1,28 @@
 import asyncio
-from collections.abc import Sequence
+from collections.abc import Awaitable, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
 import strawberry
+from pymongo import ASCENDING, IndexModel
 from pymongo.asynchronous.database import AsyncDatabase
 
 from satin.models.annotation import Annotation, BBox
-from satin.models.image import Image
 from satin.models.project import Project
 from satin.models.task import Task, TaskStatus
 from satin.schema.annotation import BBoxInput
 from satin.validators import ValidationError, validate_and_convert_object_id
 
 from .base import BaseRepository
-from .image import ImageRepository
+from .image import ImageRepository, image_from_document
 from .project import ProjectRepository
 
+# Stored status values mapped to their enum members; a dict lookup is much cheaper than TaskStatus(value)
+_TASK_STATUSES = {status.value: status for status in TaskStatus}
+
+# Fields that get_all_tasks joins in from other collections
+_JOINED_FIELDS = frozenset({"image", "project"})
+
 
 def bbox_input_to_bbox(bbox_input: BBoxInput) -> BBox:
     """Convert BBoxInput to BBox."""
@@ -36,32 +42,50 @@ def bbox_input_to_bbox(bbox_input: BBoxInput) -> BBox:
 class TaskRepository(BaseRepository[Task]):
     """Repository for Task domain objects."""
 
-    def __init__(self, db: AsyncDatabase):
-        """Initialize the TaskRepository with a database connection."""
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        image_repo: ImageRepository | None = None,
+        project_repo: ProjectRepository | None = None,
+    ):
+        """Initialize the TaskRepository, reusing the given related repositories and their caches."""
         super().__init__(db, "tasks")
-        self._image_repo = ImageRepository(db)
-        self._project_repo = ProjectRepository(db)
+        self._image_repo = image_repo if image_repo is not None else ImageRepository(db)
+        self._project_repo = project_repo if project_repo is not None else ProjectRepository(db)
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes backing the task lookups by image and project."""
+        await self.collection.create_indexes(
+            [
+                # Serves lookups by image and by image and project together
+                IndexModel([("image_id", ASCENDING), ("project_id", ASCENDING)]),
+                IndexModel([("project_id", ASCENDING)]),
+            ]
+        )
 
     async def _load_related_objects(self, task_data: dict[str, Any]) -> None:
         """Load and attach related Image and Project objects to task data."""
+        loaders: dict[str, Awaitable[Any]] = {}
         if "image_id" in task_data:
-            task_data["image"] = await self._image_repo.get_image(task_data["image_id"])
-            del task_data["image_id"]
-
+            loaders["image"] = self._image_repo.get_image(task_data.pop("image_id"))
         if "project_id" in task_data:
-            task_data["project"] = await self._project_repo.get_project(task_data["project_id"])
-            del task_data["project_id"]
+            loaders["project"] = self._project_repo.get_project(task_data.pop("project_id"))
+
+        # The lookups are independent, so issue them concurrently
+        task_data.update(zip(loaders, await asyncio.gather(*loaders.values()), strict=True))
 
     async def to_domain_object(self, data: dict[str, Any]) -> Task:
         """Convert database document to Task domain object."""
         data = self._convert_id(data)
 
-        # Convert bbox dicts to BBox objects with proper Annotation objects
+        # Convert bbox dicts to BBox objects with proper Annotation objects.
+        # Stored bboxes were validated and sanitized when they were written,
+        # so skip re-running the validators on every read.
         bboxes = []
         for bbox_data in data.get("bboxes", []):
             annotation_data = bbox_data.get("annotation", {})
-            annotation = Annotation(text=annotation_data.get("text"), tags=annotation_data.get("tags"))
-            bbox = BBox(
+            annotation = Annotation.model_construct(text=annotation_data.get("text"), tags=annotation_data.get("tags"))
+            bbox = BBox.model_construct(
                 x=bbox_data["x"],
                 y=bbox_data["y"],
                 width=bbox_data["width"],
@@ -73,7 +97,7 @@ class TaskRepository(BaseRepository[Task]):
 
         # Convert status string to enum
         if "status" in data:
-            data["status"] = TaskStatus(data["status"])
+            data["status"] = _TASK_STATUSES.get(data["status"]) or TaskStatus(data["status"])
 
         return Task(**data)
 
@@ -104,79 +128,53 @@ class TaskRepository(BaseRepository[Task]):
         if match_stage:
             pipeline.append({"$match": match_stage})
 
-        # Add lookups for related data
-        pipeline.extend(
-            [
-                {
-                    "$lookup": {
-                        "from": "images",
-                        "localField": "image_id",
-                        "foreignField": "_id",
-                        "as": "image",
-                    }
-                },
-                {"$unwind": "$image"},
-                {
-                    "$lookup": {
-                        "from": "projects",
-                        "localField": "project_id",
-                        "foreignField": "_id",
-                        "as": "project",
-                    }
-                },
-                {"$unwind": "$project"},
-            ]
-        )
+        # Lookups for related data
+        lookup_stages: list[dict[str, Any]] = [
+            {
+                "$lookup": {
+                    "from": "images",
+                    "localField": "image_id",
+                    "foreignField": "_id",
+                    "as": "image",
+                }
+            },
+            {"$unwind": "$image"},
+            {
+                "$lookup": {
+                    "from": "projects",
+                    "localField": "project_id",
+                    "foreignField": "_id",
+                    "as": "project",
+                }
+            },
+            {"$unwind": "$project"},
+        ]
 
-        # Add sort stage (after lookups so we can sort by joined fields)
+        # Sort and pagination stages
+        page_stages: list[dict[str, Any]] = []
         sort_stage = self.build_sort_stage(query_input)
         if sort_stage:
-            pipeline.append({"$sort": sort_stage})
+            page_stages.append({"$sort": sort_stage})
 
-        # Add pagination
         if query_input:
-            pipeline.extend(
-                [
-                    {"$skip": query_input.offset},
-                    {"$limit": query_input.limit if query_input.limit else 1000},
-                ]
-            )
+            page_offset, page_limit = query_input.offset, query_input.limit or 1000
         else:
-            pipeline.extend(
-                [
-                    {"$skip": offset},
-                    {"$limit": limit if limit is not None else 1000},
-                ]
-            )
+            page_offset, page_limit = offset, limit if limit is not None else 1000
+        page_stages.extend([{"$skip": page_offset}, {"$limit": page_limit}])
 
-        # Add ID conversion
-        pipeline.append(
-            {
-                "$addFields": {
-                    "id": {"$toString": "$_id"},
-                    "image.id": {"$toString": "$image._id"},
-                    "project.id": {"$toString": "$project._id"},
-                }
-            }
-        )
-
-        results: list[Task] = []
-        opt_cursor = self.collection.aggregate(pipeline)
-        if asyncio.iscoroutine(opt_cursor):
-            cursor = await opt_cursor
+        # Sorting by joined fields needs the lookups first. Otherwise page first,
+        # so only the returned tasks are joined instead of every matching task.
+        if any(field.partition(".")[0] in _JOINED_FIELDS for field in sort_stage):
+            pipeline.extend([*lookup_stages, *page_stages])
         else:
-            cursor = opt_cursor  # Handle sync cursor for testing
+            pipeline.extend([*page_stages, *lookup_stages])
 
-        async for task_data in cursor:
-            # Convert joined image and project data to proper objects
+        results: list[Task] = []
+        for task_data in await self.aggregate_to_list(pipeline, batch_size=page_limit):
+            # Convert joined image and project data to proper objects; the
+            # task's own _id is converted by to_domain_object
             if "image" in task_data:
-                image_data = task_data["image"]
-                task_data["image"] = Image(
-                    id=str(image_data["_id"]),
-                    url=image_data["url"],
-                    dimensions=image_data.get("dimensions"),
-                    metadata=image_data.get("metadata"),
-                )
+                task_data["image"] = image_from_document(self._convert_id(task_data["image"]))
 
             if "project" in task_data:
                 project_data = task_data["project"]
@@ -186,7 +184,6 @@ class TaskRepository(BaseRepository[Task]):
                     description=project_data["description"],
                 )
 
-            task_data.pop("_id", None)
             task_data.pop("image_id", None)
             task_data.pop("project_id", None)
 
@@ -221,7 +218,7 @@ class TaskRepository(BaseRepository[Task]):
         task_data = {
             "image_id": validated_image_id,
             "project_id": validated_project_id,
-            "bboxes": [x.model_dump() for x in converted_bboxes],
+            "bboxes": list(map(BBox.model_dump, converted_bboxes)),
             "status": status.value,
             "created_at": datetime.now(tz=UTC),
         }
@@ -235,9 +232,8 @@ class TaskRepository(BaseRepository[Task]):
         # Convert bboxes back to BBox objects
         created_data["bboxes"] = converted_bboxes
 
-        # Convert status string to enum
-        if "status" in created_data:
-            created_data["status"] = TaskStatus(created_data["status"])
+        # The stored status string came from this enum member
+        created_data["status"] = status
 
         return Task(**created_data)
 
@@ -269,7 +265,7 @@ class TaskRepository(BaseRepository[Task]):
                     converted_bboxes.append(bbox_input_to_bbox(bbox))
                 else:
                     converted_bboxes.append(bbox)
-            update_data["bboxes"] = [x.model_dump() for x in converted_bboxes]
+            update_data["bboxes"] = list(map(BBox.model_dump, converted_bboxes))
         if status is not None:
             update_data["status"] = status.value
 
@@ -1,4 +1,6 @@
 # Import all schema types to ensure they are registered with Strawberry
+from typing import TYPE_CHECKING, Any
+
 from .annotation import Annotation, AnnotationInput, BBox, BBoxInput
 from .filters import (
     ListFilterInput,
@@ -12,11 +14,13 @@ from .filters import (
     StringFilterOperatorEnum,
 )
 from .image import Image
-from .mutation import Mutation
 from .project import Project
-from .query import Page, Query
 from .task import Task, TaskStatus
 
+if TYPE_CHECKING:
+    from .mutation import Mutation
+    from .query import Page, Query
+
 __all__ = [
     "Annotation",
     "AnnotationInput",
@@ -39,3 +43,18 @@ __all__ = [
     "Task",
     "TaskStatus",
 ]
+
+
+# The root types pull in the database client and the repositories, which in
+# turn import from this package, so they are only imported on first access.
+_LAZY_IMPORTS = {"Mutation": ".mutation", "Page": ".query", "Query": ".query"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Query and Mutation root types on first access."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module  # noqa: PLC0415
+
+        return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
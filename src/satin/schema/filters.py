@@ -57,6 +57,13 @@ class ListFilterOperatorEnum(StrEnum):
     SIZE_LT = "size_lt"
 
 
+# GraphQL enum member -> model enum member, resolved once instead of per filter
+_SORT_DIRECTIONS = {member: SortDirection(member.value) for member in SortDirectionEnum}
+_NUMBER_OPERATORS = {member: NumberFilterOperator(member.value) for member in NumberFilterOperatorEnum}
+_STRING_OPERATORS = {member: StringFilterOperator(member.value) for member in StringFilterOperatorEnum}
+_LIST_OPERATORS = {member: ListFilterOperator(member.value) for member in ListFilterOperatorEnum}
+
+
 # Convert Pydantic models to Strawberry inputs using experimental.pydantic.input
 @strawberry.input
 class SortInput:
@@ -65,7 +72,7 @@ class SortInput:
 
     def to_pydantic(self) -> SortModel:
         """Convert to Pydantic model."""
-        return SortModel(field=self.field, direction=SortDirection(self.direction))
+        return SortModel(field=self.field, direction=_SORT_DIRECTIONS[self.direction])
 
 
 @strawberry.input
@@ -102,17 +109,17 @@ class QueryInput:
         """Convert to Pydantic model."""
         # Convert filters
         number_filters_pydantic = [
-            NumberFilterModel(field=f.field, operator=NumberFilterOperator(f.operator.value), value=f.value)
+            NumberFilterModel(field=f.field, operator=_NUMBER_OPERATORS[f.operator], value=f.value)
             for f in self.number_filters
         ]
 
         string_filters_pydantic = [
-            StringFilterModel(field=f.field, operator=StringFilterOperator(f.operator.value), value=f.value)
+            StringFilterModel(field=f.field, operator=_STRING_OPERATORS[f.operator], value=f.value)
             for f in self.string_filters
         ]
 
         list_filters_pydantic = [
-            ListFilterModel(field=f.field, operator=ListFilterOperator(f.operator.value), value=f.value)
+            ListFilterModel(field=f.field, operator=_LIST_OPERATORS[f.operator], value=f.value)
             for f in self.list_filters
         ]
 
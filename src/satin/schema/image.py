@@ -7,12 +7,16 @@ from satin.models.image import Image as ImageModel
 
 @strawberry.type
 class ImageDimensions:
+    __slots__ = ("height", "width")
+
     width: int
     height: int
 
 
 @strawberry.type
 class ImageMetadata:
+    __slots__ = ("filename", "format", "is_uploaded", "mime_type", "size", "uploaded_at")
+
     filename: str
     size: int
     mime_type: str
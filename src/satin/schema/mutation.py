@@ -1,16 +1,15 @@
+import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import NoReturn
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import strawberry
 from pymongo.errors import PyMongoError
 
 from satin.constants import MAX_DESCRIPTION_LENGTH, MAX_NAME_LENGTH
-from satin.db import db
+from satin.dependencies import get_repo_factory
 from satin.exceptions import ValidationError
-from satin.models.image import ImageDimensions, ImageMetadata
 from satin.models.task import TaskStatus
-from satin.repositories import RepositoryFactory
 from satin.schema.annotation import BBoxInput
 from satin.schema.image import Image
 from satin.schema.project import Project
@@ -18,10 +17,10 @@ from satin.schema.task import Task
 from satin.schema.utils import convert_pydantic_to_strawberry
 from satin.validators.sanitization_decorator import sanitize_graphql_mutation
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
 
-# Global repository factory instance
-repo_factory = RepositoryFactory(db)
+logger = logging.getLogger(__name__)
 
 # Error message constants
 PROJECT_NOT_FOUND_ERROR = "Project with id %s not found"
@@ -173,15 +172,20 @@ def _raise_image_has_tasks() -> NoReturn:
 
 async def _validate_task_update_references(project_id: strawberry.ID | None, image_id: strawberry.ID | None) -> None:
     """Validate project and image exist for task update."""
+    repo_factory = get_repo_factory()
+    loaders: dict[str, Awaitable[Any]] = {}
     if project_id:
-        project = await repo_factory.project_repo.get_project(project_id)
-        if not project:
-            _raise_project_not_found(str(project_id))
-
+        loaders["project"] = repo_factory.project_repo.get_project(project_id)
     if image_id:
-        image = await repo_factory.image_repo.get_image(image_id)
-        if not image:
-            _raise_image_not_found(str(image_id))
+        loaders["image"] = repo_factory.image_repo.get_image(image_id)
+
+    # The lookups are independent, so issue them concurrently
+    found = dict(zip(loaders, await asyncio.gather(*loaders.values()), strict=True))
+
+    if "project" in found and not found["project"]:
+        _raise_project_not_found(str(project_id))
+    if "image" in found and not found["image"]:
+        _raise_image_not_found(str(image_id))
 
 
 async def _validate_project_update_input(name: str | None, description: str | None) -> None:
@@ -210,13 +214,14 @@ class Mutation:
         status: TaskStatus = TaskStatus.DRAFT,
     ) -> Task:
         """Create a new task."""
+        repo_factory = get_repo_factory()
         try:
-            # Validate that project and image exist
-            project = await repo_factory.project_repo.get_project(project_id)
+            # Validate that project and image exist, looking both up concurrently
+            project, image = await asyncio.gather(
+                repo_factory.project_repo.get_project(project_id), repo_factory.image_repo.get_image(image_id)
+            )
             if not project:
                 _raise_project_not_found(str(project_id))
-
-            image = await repo_factory.image_repo.get_image(image_id)
             if not image:
                 _raise_image_not_found(str(image_id))
 
@@ -247,6 +252,7 @@ class Mutation:
         status: TaskStatus | None = None,
     ) -> Task:
         """Update an existing task."""
+        repo_factory = get_repo_factory()
         try:
             # Check if task exists
             existing_task = await repo_factory.task_repo.get_task(id)
@@ -280,6 +286,7 @@ class Mutation:
     @sanitize_graphql_mutation
     async def delete_task(self, id: strawberry.ID) -> bool:  # noqa: A002
         """Delete a task."""
+        repo_factory = get_repo_factory()
         # Check if task exists
         existing_task = await repo_factory.task_repo.get_task(id)
         if not existing_task:
@@ -301,7 +308,7 @@ class Mutation:
     async def create_project(self, name: str, description: str) -> Project:
         """Create a new project."""
         try:
-            pydantic_project = await repo_factory.project_repo.create_project(name=name, description=description)
+            pydantic_project = await get_repo_factory().project_repo.create_project(name=name, description=description)
             return convert_pydantic_to_strawberry(pydantic_project, Project)
         except ValidationError as e:
             logger.exception("Validation error creating project")
@@ -322,12 +329,17 @@ class Mutation:
         description: str | None = None,
     ) -> Project:
         """Update an existing project."""
+        repo_factory = get_repo_factory()
         try:
             # Check if project exists
             existing_project = await repo_factory.project_repo.get_project(id)
             if not existing_project:
                 _raise_project_not_found(str(id))
 
+            # Nothing to change, so skip the write and the re-read
+            if name is None and description is None:
+                return convert_pydantic_to_strawberry(existing_project, Project)
+
             success = await repo_factory.project_repo.update_project(project_id=id, name=name, description=description)
             if not success:
                 _raise_failed_update_project(str(id))
@@ -350,6 +362,7 @@ class Mutation:
     @sanitize_graphql_mutation
     async def delete_project(self, id: strawberry.ID) -> bool:  # noqa: A002
         """Delete a project."""
+        repo_factory = get_repo_factory()
         # Check if project exists
         existing_project = await repo_factory.project_repo.get_project(id)
         if not existing_project:
@@ -381,7 +394,7 @@ class Mutation:
                 _raise_image_url_empty()
 
             # The URL validation happens in the repository through validators
-            pydantic_image = await repo_factory.image_repo.create_image(url=url)
+            pydantic_image = await get_repo_factory().image_repo.create_image(url=url)
             return convert_pydantic_to_strawberry(pydantic_image, Image)
         except ValidationError as e:
             logger.exception("Validation error creating image")
@@ -411,20 +424,22 @@ class Mutation:
             if not url or not url.strip():
                 _raise_image_url_empty()
 
-            # Create metadata
-            dimensions = ImageDimensions(width=width, height=height)
-            metadata = ImageMetadata(
-                filename=filename,
-                size=size,
-                mime_type=mime_type,
-                format=image_format,
-                uploaded_at=datetime.now(UTC),
-                is_uploaded=True,
-            )
+            # Create metadata. The arguments are already typed by the GraphQL layer and
+            # the stored document is validated once as an Image, so build the documents
+            # directly instead of round-tripping through ImageDimensions/ImageMetadata.
+            dimensions = {"width": width, "height": height}
+            metadata = {
+                "filename": filename,
+                "size": size,
+                "mime_type": mime_type,
+                "format": image_format,
+                "uploaded_at": datetime.now(UTC),
+                "is_uploaded": True,
+            }
 
             # Create image with metadata
-            pydantic_image = await repo_factory.image_repo.create_image(
-                url=url, metadata={"dimensions": dimensions.model_dump(), "metadata": metadata.model_dump()}
+            pydantic_image = await get_repo_factory().image_repo.create_image(
+                url=url, metadata={"dimensions": dimensions, "metadata": metadata}
             )
             return convert_pydantic_to_strawberry(pydantic_image, Image)
         except ValidationError as e:
@@ -445,6 +460,7 @@ class Mutation:
         url: str | None = None,
     ) -> Image:
         """Update an existing image."""
+        repo_factory = get_repo_factory()
         try:
             # Check if image exists
             existing_image = await repo_factory.image_repo.get_image(id)
@@ -477,6 +493,7 @@ class Mutation:
     @sanitize_graphql_mutation
     async def delete_image(self, id: strawberry.ID) -> bool:  # noqa: A002
         """Delete an image."""
+        repo_factory = get_repo_factory()
         # Check if image exists
         existing_image = await repo_factory.image_repo.get_image(id)
         if not existing_image:
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 import strawberry
 
-from satin.db import db
-from satin.repositories import RepositoryFactory
+from satin.dependencies import get_repo_factory
 from satin.schema.filters import QueryInput  # noqa: TC001
 from satin.schema.image import Image
 from satin.schema.project import Project
 from satin.schema.task import Task
-from satin.schema.utils import convert_pydantic_to_strawberry
+from satin.schema.utils import convert_pydantic_list_to_strawberry, convert_pydantic_to_strawberry
 
-# Global repository factory instance
-repo_factory = RepositoryFactory(db)
+if TYPE_CHECKING:
+    from satin.models.task import Task as TaskModel
 
 T = TypeVar("T")
 
 
+def _convert_tasks(pydantic_tasks: list[TaskModel]) -> list[Task]:
+    """Convert tasks to Strawberry types, converting each distinct image and project only once.
+
+    Tasks of a page often share their project (and sometimes their image), so the
+    converted objects are reused within the page instead of being rebuilt per task.
+    """
+    images: dict[str, Image] = {}
+    projects: dict[str, Project] = {}
+    tasks = []
+    for task in pydantic_tasks:
+        image = images.get(task.image.id)
+        if image is None:
+            image = images[task.image.id] = convert_pydantic_to_strawberry(task.image, Image)
+        project = projects.get(task.project.id)
+        if project is None:
+            project = projects[task.project.id] = convert_pydantic_to_strawberry(task.project, Project)
+        # Every other field goes through from_pydantic, so fields added to the model are not dropped
+        converted = convert_pydantic_to_strawberry(task.model_copy(update={"image": None, "project": None}), Task)
+        converted.image = image
+        converted.project = project
+        tasks.append(converted)
+    return tasks
+
+
 @strawberry.type
 class Page[T]:
     """Generic connection type for pagination."""
@@ -37,7 +60,7 @@ class Query:
     @strawberry.field
     async def project(self, id: strawberry.ID) -> Project | None:  # noqa: A002
         """Get a project by ID."""
-        pydantic_project = await repo_factory.project_repo.get_project(id)
+        pydantic_project = await get_repo_factory().project_repo.get_project(id)
         if pydantic_project is None:
             return None
         return convert_pydantic_to_strawberry(pydantic_project, Project)
@@ -52,11 +75,12 @@ class Query:
         actual_limit = query_model.limit if query_model else limit
         actual_offset = query_model.offset if query_model else offset
 
-        pydantic_projects = await repo_factory.project_repo.get_all_projects(
+        project_repo = get_repo_factory().project_repo
+        pydantic_projects = await project_repo.get_all_projects(
             limit=actual_limit, offset=actual_offset, query_input=query_model
         )
-        projects = [convert_pydantic_to_strawberry(p, Project) for p in pydantic_projects]
-        total_count = await repo_factory.project_repo.count_all_projects(query_input=query_model)
+        projects = convert_pydantic_list_to_strawberry(pydantic_projects, Project)
+        total_count = await project_repo.count_all_projects(query_input=query_model)
         has_more = actual_offset + len(projects) < total_count
         return Page(
             objects=projects,
@@ -70,7 +94,7 @@ class Query:
     @strawberry.field
     async def image(self, id: strawberry.ID) -> Image | None:  # noqa: A002
         """Get an image by ID."""
-        pydantic_image = await repo_factory.image_repo.get_image(id)
+        pydantic_image = await get_repo_factory().image_repo.get_image(id)
         if pydantic_image is None:
             return None
         return convert_pydantic_to_strawberry(pydantic_image, Image)
@@ -84,11 +108,12 @@ class Query:
         actual_limit = query_model.limit if query_model else limit
         actual_offset = query_model.offset if query_model else offset
 
-        pydantic_images = await repo_factory.image_repo.get_all_images(
+        image_repo = get_repo_factory().image_repo
+        pydantic_images = await image_repo.get_all_images(
             limit=actual_limit, offset=actual_offset, query_input=query_model
         )
-        images = [convert_pydantic_to_strawberry(img, Image) for img in pydantic_images]
-        total_count = await repo_factory.image_repo.count_all_images(query_input=query_model)
+        images = convert_pydantic_list_to_strawberry(pydantic_images, Image)
+        total_count = await image_repo.count_all_images(query_input=query_model)
         has_more = actual_offset + len(images) < total_count
         return Page(
             objects=images,
@@ -102,7 +127,7 @@ class Query:
     @strawberry.field
     async def task(self, id: strawberry.ID) -> Task | None:  # noqa: A002
         """Get a task by ID."""
-        pydantic_task = await repo_factory.task_repo.get_task(id)
+        pydantic_task = await get_repo_factory().task_repo.get_task(id)
         if pydantic_task is None:
             return None
         return convert_pydantic_to_strawberry(pydantic_task, Task)
@@ -116,11 +141,12 @@ class Query:
         actual_limit = query_model.limit if query_model else limit
         actual_offset = query_model.offset if query_model else offset
 
-        pydantic_tasks = await repo_factory.task_repo.get_all_tasks(
+        task_repo = get_repo_factory().task_repo
+        pydantic_tasks = await task_repo.get_all_tasks(
             limit=actual_limit, offset=actual_offset, query_input=query_model
         )
-        tasks = [convert_pydantic_to_strawberry(task, Task) for task in pydantic_tasks]
-        total_count = await repo_factory.task_repo.count_all_tasks(query_input=query_model)
+        tasks = _convert_tasks(pydantic_tasks)
+        total_count = await task_repo.count_all_tasks(query_input=query_model)
         has_more = actual_offset + len(tasks) < total_count
         return Page(
             objects=tasks,
@@ -134,7 +160,7 @@ class Query:
     @strawberry.field
     async def task_by_image_and_project(self, image_id: strawberry.ID, project_id: strawberry.ID) -> Task | None:
         """Get a task by image and project IDs."""
-        pydantic_task = await repo_factory.task_repo.get_task_by_image_and_project(image_id, project_id)
+        pydantic_task = await get_repo_factory().task_repo.get_task_by_image_and_project(image_id, project_id)
         if pydantic_task is None:
             return None
         return convert_pydantic_to_strawberry(pydantic_task, Task)
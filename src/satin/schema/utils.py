@@ -1,13 +1,14 @@
 """Utility functions for schema operations."""
 
 import re
+from collections.abc import Iterable
 from typing import Any, TypeVar, get_type_hints
 
 import strawberry
 
-from satin.exceptions import ValidationError as BaseValidationError
 from satin.schema.filters import ListFilterOperator, NumberFilterOperator, StringFilterOperator
-from satin.validators import _validate_regex_pattern, validate_and_convert_object_id
+from satin.validators import _validate_regex_pattern
+from satin.validators.input_sanitizer import parse_object_id
 
 # Type conversion utilities
 T = TypeVar("T")
@@ -45,13 +46,10 @@ def convert_filter_value(value: Any, target_type: type) -> Any:
 
     # Handle ObjectId conversion for ID fields
     if target_type in {strawberry.ID, "ID"} or str(target_type).endswith("ID"):
-        if isinstance(value, str):
-            try:
-                return validate_and_convert_object_id(value)
-            except BaseValidationError:
-                # Return the original value if validation fails
-                # This allows for non-ObjectId IDs in some cases
-                return value
+        # Only well-formed ObjectIds are converted; anything else is passed
+        # through unchanged, which allows for non-ObjectId IDs in some cases
+        if isinstance(value, str) and (object_id := parse_object_id(value.strip())) is not None:
+            return object_id
         return value
 
     # Handle basic type conversions
@@ -64,22 +62,33 @@ def convert_filter_value(value: Any, target_type: type) -> Any:
     return type_converters.get(target_type, lambda v: v)(value)
 
 
+# MongoDB operators per filter operator, built once at import instead of on every filter
+_NUMBER_LIST_OPERATORS = {NumberFilterOperator.IN: "$in", NumberFilterOperator.NIN: "$nin"}
+_NUMBER_COMPARISON_OPERATORS = {
+    NumberFilterOperator.EQ: None,
+    NumberFilterOperator.NE: "$ne",
+    NumberFilterOperator.GT: "$gt",
+    NumberFilterOperator.LT: "$lt",
+    NumberFilterOperator.GTE: "$gte",
+    NumberFilterOperator.LTE: "$lte",
+}
+# Case-insensitive regex templates, filled in with the escaped value
+_STRING_MATCH_PATTERNS = {
+    StringFilterOperator.CONTAINS: "{}",
+    StringFilterOperator.STARTS_WITH: "^{}",
+    StringFilterOperator.ENDS_WITH: "{}$",
+}
+_STRING_LIST_OPERATORS = {StringFilterOperator.IN: "$in", StringFilterOperator.NIN: "$nin"}
+_LIST_ARRAY_OPERATORS = {ListFilterOperator.CONTAINS_ALL: "$all", ListFilterOperator.CONTAINS_ANY: "$in"}
+
+
 def _build_number_filter(field: str, operator: NumberFilterOperator, value: Any) -> dict[str, Any]:
     """Build MongoDB filter condition for numeric fields."""
-    list_operators = {NumberFilterOperator.IN: "$in", NumberFilterOperator.NIN: "$nin"}
-    single_operators = {
-        NumberFilterOperator.EQ: None,
-        NumberFilterOperator.NE: "$ne",
-        NumberFilterOperator.GT: "$gt",
-        NumberFilterOperator.LT: "$lt",
-        NumberFilterOperator.GTE: "$gte",
-        NumberFilterOperator.LTE: "$lte",
-    }
-    if operator in list_operators:
+    if operator in _NUMBER_LIST_OPERATORS:
         value_list = value if isinstance(value, list) else [value]
-        return {field: {list_operators[operator]: value_list}}
-    if operator in single_operators:
-        mongo_operator = single_operators[operator]
+        return {field: {_NUMBER_LIST_OPERATORS[operator]: value_list}}
+    if operator in _NUMBER_COMPARISON_OPERATORS:
+        mongo_operator = _NUMBER_COMPARISON_OPERATORS[operator]
         return {field: value if mongo_operator is None else {mongo_operator: value}}
 
     msg = f"Unsupported number operator: {operator}"
@@ -88,25 +97,17 @@ def _build_number_filter(field: str, operator: NumberFilterOperator, value: Any)
 
 def _build_string_filter(field: str, operator: StringFilterOperator, value: Any) -> dict[str, Any]:
     """Build MongoDB filter condition for string fields."""
-    str_value = str(value)
-
-    # Validate regex patterns for security
+    if operator in _STRING_MATCH_PATTERNS:
+        pattern = _STRING_MATCH_PATTERNS[operator].format(re.escape(str(value)))
+        return {field: {"$regex": pattern, "$options": "i"}}
     if operator == StringFilterOperator.REGEX:
+        str_value = str(value)
+        # Validate regex patterns for security
         _validate_regex_pattern(str_value)
-
-    regex_operators = {
-        StringFilterOperator.CONTAINS: {"$regex": re.escape(str_value), "$options": "i"},
-        StringFilterOperator.STARTS_WITH: {"$regex": f"^{re.escape(str_value)}", "$options": "i"},
-        StringFilterOperator.ENDS_WITH: {"$regex": f"{re.escape(str_value)}$", "$options": "i"},
-        StringFilterOperator.REGEX: {"$regex": str_value},
-    }
-    list_operators = {StringFilterOperator.IN: "$in", StringFilterOperator.NIN: "$nin"}
-
-    if operator in regex_operators:
-        return {field: regex_operators[operator]}
-    if operator in list_operators:
+        return {field: {"$regex": str_value}}
+    if operator in _STRING_LIST_OPERATORS:
         value_list = value if isinstance(value, list) else [value]
-        return {field: {list_operators[operator]: value_list}}
+        return {field: {_STRING_LIST_OPERATORS[operator]: value_list}}
     if operator in {StringFilterOperator.EQ, StringFilterOperator.NE}:
         return {field: value if operator == StringFilterOperator.EQ else {"$ne": value}}
 
@@ -116,21 +117,20 @@ def _build_string_filter(field: str, operator: StringFilterOperator, value: Any)
 
 def _build_list_filter(field: str, operator: ListFilterOperator, value: Any) -> dict[str, Any]:
     """Build MongoDB filter condition for list/array fields."""
-    list_operators: dict[ListFilterOperator, Any] = {
-        ListFilterOperator.CONTAINS: value,
-        ListFilterOperator.CONTAINS_ALL: {"$all": value if isinstance(value, list) else [value]},
-        ListFilterOperator.CONTAINS_ANY: {"$in": value if isinstance(value, list) else [value]},
-    }
-    size_operators: dict[ListFilterOperator, dict[str, Any]] = {
-        ListFilterOperator.SIZE_EQ: {"$size": int(value)},
-        ListFilterOperator.SIZE_GT: {f"{field}.{int(value)}": {"$exists": True}},
-        ListFilterOperator.SIZE_LT: ({f"{field}.{int(value) - 1}": {"$exists": False}} if int(value) > 0 else {}),
-    }
+    if operator == ListFilterOperator.CONTAINS:
+        return {field: value}
+    if operator in _LIST_ARRAY_OPERATORS:
+        value_list = value if isinstance(value, list) else [value]
+        return {field: {_LIST_ARRAY_OPERATORS[operator]: value_list}}
 
-    if operator in list_operators:
-        return {field: list_operators[operator]}
-    if operator in size_operators:
-        return size_operators[operator]
+    # Only the size operators take a number, so the value is converted for them alone
+    if operator == ListFilterOperator.SIZE_EQ:
+        return {field: {"$size": int(value)}}
+    if operator == ListFilterOperator.SIZE_GT:
+        return {f"{field}.{int(value)}": {"$exists": True}}
+    if operator == ListFilterOperator.SIZE_LT:
+        size = int(value)
+        return {f"{field}.{size - 1}": {"$exists": False}} if size > 0 else {}
 
     msg = f"Unsupported list operator: {operator}"
     raise ValueError(msg)
@@ -180,3 +180,23 @@ def convert_pydantic_to_strawberry[T](pydantic_model: Any, strawberry_class: typ
     # This should not happen with properly decorated classes
     msg = FROM_PYDANTIC_NOT_FOUND_ERROR % strawberry_class.__name__
     raise AttributeError(msg)
+
+
+def convert_pydantic_list_to_strawberry[T](pydantic_models: Iterable[Any], strawberry_class: type[T]) -> list[T]:
+    """Convert several Pydantic models to a Strawberry type.
+
+    Looks up the from_pydantic method once for the whole list instead of once per model.
+
+    Args:
+        pydantic_models: The Pydantic model instances to convert
+        strawberry_class: The Strawberry class to convert to
+
+    Returns:
+        Instances of the Strawberry class, in the order of the given models
+
+    """
+    from_pydantic = getattr(strawberry_class, "from_pydantic", None)
+    if from_pydantic is None:
+        msg = FROM_PYDANTIC_NOT_FOUND_ERROR % strawberry_class.__name__
+        raise AttributeError(msg)
+    return [from_pydantic(pydantic_model) for pydantic_model in pydantic_models]
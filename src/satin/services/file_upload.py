@@ -7,7 +7,7 @@ from typing import Any
 from fastapi import HTTPException, UploadFile
 from PIL import Image
 
-from satin.config import config
+from satin.config import get_config
 
 
 class FileUploadService:
@@ -15,8 +15,10 @@ class FileUploadService:
 
     def __init__(self):
         """Initialize the file upload service."""
+        config = get_config()
         self.upload_dir = Path(config.upload_directory)
         self.max_file_size = config.max_file_size  # 10MB default
+        self.base_url = config.base_url
         self.allowed_mime_types = {
             "image/jpeg",
             "image/jpg",
@@ -91,7 +93,7 @@ class FileUploadService:
             raise HTTPException(status_code=500, detail=f"Failed to save file: {e!s}") from e
 
         # Generate accessible URL
-        file_url = f"{config.base_url}/uploads/{unique_filename}"
+        file_url = f"{self.base_url}/uploads/{unique_filename}"
 
         return {
             "url": file_url,
@@ -115,11 +115,31 @@ def sanitize_html(value: str, max_length: int = MAX_STRING_LENGTH) -> str:
     )
 
 
-def validate_and_convert_object_id(value: str | strawberry.ID) -> ObjectId:
+def parse_object_id(id_str: str) -> ObjectId | None:
+    """Convert a well-formed 24 character hex string to an ObjectId.
+
+    Args:
+        id_str: The ID string to convert
+
+    Returns:
+        The ObjectId, or None if the string is not 24 hex characters
+
+    """
+    if len(id_str) != OBJECT_ID_LENGTH:
+        return None
+    try:
+        raw = bytes.fromhex(id_str)
+    except ValueError:
+        return None
+    # fromhex skips whitespace, so only 12 decoded bytes mean 24 hex digits
+    return ObjectId(raw) if len(raw) == OBJECT_ID_LENGTH // 2 else None
+
+
+def validate_and_convert_object_id(value: str | strawberry.ID | ObjectId) -> ObjectId:
     """Safely validate and convert a string to MongoDB ObjectId.
 
     Args:
-        value: The ID string to convert
+        value: The ID string to convert, or an already converted ObjectId
 
     Returns:
         Valid ObjectId
@@ -128,6 +148,10 @@ def validate_and_convert_object_id(value: str | strawberry.ID) -> ObjectId:
         ObjectIdValidationError: If the ID is invalid
 
     """
+    # Mutation arguments are already converted by the sanitization decorator
+    if isinstance(value, ObjectId):
+        return value
+
     if not value:
         raise ObjectIdValidationError.empty_id()
 
@@ -137,6 +161,11 @@ def validate_and_convert_object_id(value: str | strawberry.ID) -> ObjectId:
     # Remove any whitespace
     id_str = id_str.strip()
 
+    # Fast path for well-formed IDs; anything else goes through the checks
+    # below so the error reports what is actually wrong
+    if (object_id := parse_object_id(id_str)) is not None:
+        return object_id
+
     # Check for common injection patterns
     if any(char in id_str for char in ["$", "{", "}", "[", "]", "(", ")", ";", "'"]):
         raise ObjectIdValidationError.invalid_characters()
@@ -246,10 +275,11 @@ def validate_tags(tags: list[str] | None) -> list[str] | None:
 
     for tag in tags:
         validated_tag = validate_tag(tag)
-        # Prevent duplicate tags
-        if validated_tag.lower() in seen_tags:
+        # Prevent duplicate tags (case-insensitive)
+        tag_key = validated_tag.lower()
+        if tag_key in seen_tags:
             continue
-        seen_tags.add(validated_tag.lower())
+        seen_tags.add(tag_key)
         validated_tags.append(validated_tag)
 
     return validated_tags
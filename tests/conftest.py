@@ -1,5 +1,4 @@
 import asyncio
-import os
 import uuid
 from contextlib import suppress
 from typing import Any
@@ -8,6 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 from mongomock_motor import AsyncMongoMockClient
 
+from satin.config import Config
 from satin.main import create_app
 from satin.repositories import ImageRepository, ProjectRepository, TaskRepository
 from satin.repositories.factory import RepositoryFactory
@@ -126,18 +126,10 @@ class DatabaseFactory:
         return db, client, repos
 
     @staticmethod
-    def create_graphql_client(db, monkeypatch):
+    def create_graphql_client(db):
         """Create a GraphQL test client with proper database mocking."""
-        test_repo_factory = RepositoryFactory(db)
-
-        # Patch the global repo_factory instances in query and mutation modules
-        monkeypatch.setattr("satin.schema.query.repo_factory", test_repo_factory)
-        monkeypatch.setattr("satin.schema.mutation.repo_factory", test_repo_factory)
-
-        # Disable rate limiting for tests
-        os.environ["DISABLE_RATE_LIMITING"] = "true"
-
-        app = create_app()
+        # Disable rate limiting for tests, and serve every request of this client from the test database
+        app = create_app(settings=Config(disable_rate_limiting=True), repositories=RepositoryFactory(db))
         return GraphQLTestClient(TestClient(app))
 
 
@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from satin.models.annotation import Annotation, BBox
 
 
@@ -114,6 +117,26 @@ class TestBBox:
         assert bbox.width == 100.5555
         assert bbox.height == 200.4444
 
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("x", -1.0), ("y", 10001.0), ("width", 0.0), ("height", 10001.0)],
+    )
+    def test_bbox_coordinates_out_of_range(self, field: str, value: float):
+        """Test that coordinates outside the allowed range are rejected."""
+        coordinates = {"x": 10.0, "y": 20.0, "width": 100.0, "height": 200.0, field: value}
+
+        with pytest.raises(ValidationError, match=field):
+            BBox(**coordinates, annotation=Annotation())
+
+    def test_bbox_is_immutable(self):
+        """Test that BBox and its annotation cannot be modified after creation."""
+        bbox = BBox(x=10.0, y=20.0, width=100.0, height=200.0, annotation=Annotation(text="fixed"))
+
+        with pytest.raises(ValidationError, match="frozen"):
+            bbox.x = 30.0
+        with pytest.raises(ValidationError, match="frozen"):
+            bbox.annotation.text = "changed"
+
 
 class TestAnnotationBBoxIntegration:
     """Test cases for integration between Annotation and BBox."""
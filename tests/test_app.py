@@ -0,0 +1,119 @@
+"""Tests for the FastAPI application factory."""
+
+import logging
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from pymongo import AsyncMongoClient
+
+from satin import dependencies, main
+from satin.config import Config
+from satin.main import create_app
+from satin.repositories import RepositoryFactory
+from tests.conftest import DatabaseFactory
+
+
+class TestCreateApp:
+    """Test cases for create_app."""
+
+    def test_health_check(self):
+        """Test that every created app serves the health endpoint."""
+        client = TestClient(create_app())
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+
+    async def test_given_repositories_skip_shared_client(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that an app given its own repositories never creates the shared client or factory."""
+        db, _ = await DatabaseFactory.create_test_db()
+
+        def fail() -> None:
+            pytest.fail("the shared MongoDB client was created")
+
+        monkeypatch.setattr(main, "get_client", fail)
+        monkeypatch.setattr(dependencies, "get_db", fail)
+        dependencies.get_default_repo_factory.cache_clear()
+
+        with TestClient(create_app(repositories=RepositoryFactory(db))) as client:
+            response = client.get("/health")
+
+        assert response.status_code == 200
+
+    def test_unreachable_database_does_not_block_startup(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that startup gives up on an unreachable MongoDB quickly and logs why."""
+        monkeypatch.setattr(main, "STARTUP_DB_TIMEOUT_SECONDS", 0.2)
+        monkeypatch.setattr(main, "get_client", lambda: AsyncMongoClient("mongodb://127.0.0.1:1/satin"))
+
+        started = time.monotonic()
+        with caplog.at_level(logging.WARNING, logger="satin.main"), TestClient(create_app()) as client:
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert time.monotonic() - started < 5
+        record = next(record for record in caplog.records if "not reachable" in record.getMessage())
+        assert record.exc_info is not None
+
+    def test_requests_are_logged(self, caplog: pytest.LogCaptureFixture):
+        """Test that requests and their response status are logged."""
+        client = TestClient(create_app())
+
+        with caplog.at_level(logging.INFO, logger="satin.middleware.logging"):
+            client.get("/health")
+
+        assert "Request: GET http://testserver/health" in caplog.text
+        assert "Response: 200" in caplog.text
+
+    def test_security_headers(self):
+        """Test that security headers are added to responses, but not to health checks."""
+        settings = Config(CORS_ORIGINS=["https://satin.example.com"])
+        client = TestClient(create_app(settings))
+
+        response = client.get("/graphql")
+        health = client.get("/health")
+
+        assert "connect-src 'self' https://satin.example.com" in response.headers["content-security-policy"]
+        assert response.headers["x-frame-options"] == "DENY"
+        assert "strict-transport-security" not in response.headers
+        assert "content-security-policy" not in health.headers
+
+    def test_hsts_header_over_https(self):
+        """Test that the HSTS header is only added to HTTPS responses."""
+        client = TestClient(create_app(), base_url="https://testserver")
+
+        response = client.get("/graphql")
+
+        assert response.headers["strict-transport-security"] == "max-age=31536000; includeSubDomains"
+
+    def test_uses_given_settings(self):
+        """Test that explicit settings are used instead of the shared config."""
+        settings = Config(CORS_ORIGINS=["https://satin.example.com"])
+        client = TestClient(create_app(settings))
+
+        response = client.options(
+            "/graphql",
+            headers={"Origin": "https://satin.example.com", "Access-Control-Request-Method": "POST"},
+        )
+
+        assert response.headers["access-control-allow-origin"] == "https://satin.example.com"
+
+    def test_cors_origin_regex(self):
+        """Test that origins matching the configured regex are allowed."""
+        settings = Config(CORS_ORIGINS=[], CORS_ORIGIN_REGEX=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$")
+        client = TestClient(create_app(settings))
+
+        allowed = client.options(
+            "/graphql",
+            headers={"Origin": "http://localhost:4173", "Access-Control-Request-Method": "POST"},
+        )
+        rejected = client.options(
+            "/graphql",
+            headers={"Origin": "https://evil.example.com", "Access-Control-Request-Method": "POST"},
+        )
+
+        assert allowed.headers["access-control-allow-origin"] == "http://localhost:4173"
+        assert "access-control-allow-origin" not in rejected.headers
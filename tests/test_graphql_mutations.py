@@ -1,18 +1,16 @@
 """Tests for GraphQL mutations."""
 
-import pytest
-
-from tests.conftest import DatabaseFactory, TestDataFactory
+from tests.conftest import DatabaseFactory, GraphQLTestClient, TestDataFactory
 
 
 class TestProjectMutations:
     """Test GraphQL mutations for projects."""
 
-    async def test_create_project(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_project(self):
         """Test creating a project."""
         # Create test database and GraphQL client in the current event loop
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         mutation = """
@@ -33,10 +31,10 @@ class TestProjectMutations:
         assert project["description"] == "A brand new project"
         assert project["id"]
 
-    async def test_update_project(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_update_project(self):
         """Test updating a project."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # First create a project
@@ -74,10 +72,10 @@ class TestProjectMutations:
         assert updated_project["name"] == "Updated Name"
         assert updated_project["description"] == "Updated Description"
 
-    async def test_update_project_partial(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_update_project_partial(self):
         """Test updating a project with only some fields."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create a project
@@ -112,10 +110,46 @@ class TestProjectMutations:
         assert updated_project["name"] == "New Name Only"
         assert updated_project["description"] == "Original Description"  # Should remain unchanged
 
-    async def test_delete_project(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_update_project_no_changes(self):
+        """Test that updating a project without any fields returns it unchanged."""
+        db, client = await DatabaseFactory.create_test_db()
+        gql = DatabaseFactory.create_graphql_client(db)
+        test_data = TestDataFactory()
+
+        create_mutation = """
+        mutation CreateProject($name: String!, $description: String!) {
+            createProject(name: $name, description: $description) {
+                id
+            }
+        }
+        """
+
+        project_input = test_data.create_project_input("Original Name", "Original Description")
+        create_result = gql.mutate(create_mutation, project_input)
+        project_id = create_result["createProject"]["id"]
+
+        update_mutation = """
+        mutation UpdateProject($id: ID!) {
+            updateProject(id: $id) {
+                id
+                name
+                description
+            }
+        }
+        """
+
+        update_result = gql.mutate(update_mutation, {"id": project_id})
+
+        assert update_result["updateProject"] == {
+            "id": project_id,
+            "name": "Original Name",
+            "description": "Original Description",
+        }
+
+    async def test_delete_project(self):
         """Test deleting a project."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create a project
@@ -153,10 +187,10 @@ class TestProjectMutations:
         query_result = gql.query(query, {"id": project_id})
         assert query_result["project"] is None
 
-    async def test_delete_nonexistent_project(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_delete_nonexistent_project(self):
         """Test deleting a project that doesn't exist."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         delete_mutation = """
         mutation DeleteProject($id: ID!) {
@@ -176,10 +210,10 @@ class TestProjectMutations:
 class TestImageMutations:
     """Test GraphQL mutations for images."""
 
-    async def test_create_image(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_image(self):
         """Test creating an image."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         mutation = """
@@ -198,10 +232,61 @@ class TestImageMutations:
         assert image["url"] == "https://example.com/new-image.jpg"
         assert image["id"]
 
-    async def test_update_image(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_image_from_upload(self):
+        """Test creating an image with upload metadata."""
+        db, client = await DatabaseFactory.create_test_db()
+        gql = DatabaseFactory.create_graphql_client(db)
+
+        mutation = """
+        mutation CreateImageFromUpload(
+            $url: String!, $filename: String!, $size: Int!, $mimeType: String!, $width: Int!, $height: Int!
+        ) {
+            createImageFromUpload(
+                url: $url, filename: $filename, size: $size, mimeType: $mimeType, width: $width, height: $height
+            ) {
+                id
+                dimensions {
+                    width
+                    height
+                }
+                metadata {
+                    filename
+                    size
+                    mimeType
+                    format
+                    uploadedAt
+                    isUploaded
+                }
+            }
+        }
+        """
+
+        result = gql.mutate(
+            mutation,
+            {
+                "url": "/uploads/photo.png",
+                "filename": "photo.png",
+                "size": 2048,
+                "mimeType": "image/png",
+                "width": 640,
+                "height": 480,
+            },
+        )
+
+        image = result["createImageFromUpload"]
+        assert image["id"]
+        assert image["dimensions"] == {"width": 640, "height": 480}
+        assert image["metadata"]["filename"] == "photo.png"
+        assert image["metadata"]["size"] == 2048
+        assert image["metadata"]["mimeType"] == "image/png"
+        assert image["metadata"]["format"] is None
+        assert image["metadata"]["uploadedAt"]
+        assert image["metadata"]["isUploaded"] is True
+
+    async def test_update_image(self):
         """Test updating an image."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create an image
@@ -234,10 +319,10 @@ class TestImageMutations:
         assert updated_image["id"] == image_id
         assert updated_image["url"] == "https://example.com/updated.jpg"
 
-    async def test_delete_image(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_delete_image(self):
         """Test deleting an image."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create an image
@@ -280,10 +365,8 @@ class TestTaskMutations:
     """Test GraphQL mutations for tasks."""
 
     @staticmethod
-    async def set_up_dependencies(monkeypatch: pytest.MonkeyPatch):
-        """Create project and image for task tests."""
-        db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+    async def set_up_dependencies(gql: GraphQLTestClient):
+        """Create project and image for task tests through the given client."""
         test_data = TestDataFactory()
 
         # Create project
@@ -316,12 +399,12 @@ class TestTaskMutations:
 
         return {"project_id": project_id, "image_id": image_id}
 
-    async def test_create_task(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_task(self):
         """Test creating a task."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         mutation = """
         mutation CreateTask($imageId: ID!, $projectId: ID!, $bboxes: [BBoxInput!], $status: TaskStatus!) {
@@ -362,11 +445,11 @@ class TestTaskMutations:
         assert task["bboxes"][0]["annotation"]["text"] == "test object"
         assert task["createdAt"]
 
-    async def test_create_task_minimal(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_task_minimal(self):
         """Test creating a task with minimal data."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         mutation = """
         mutation CreateTask($imageId: ID!, $projectId: ID!) {
@@ -387,15 +470,12 @@ class TestTaskMutations:
         assert task["status"] == "DRAFT"  # Default status
         assert task["bboxes"] == []  # Default empty list
 
-    async def test_create_task_with_complex_bboxes(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ):
+    async def test_create_task_with_complex_bboxes(self):
         """Test creating a task with multiple complex bounding boxes."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         mutation = """
         mutation CreateTask($imageId: ID!, $projectId: ID!, $bboxes: [BBoxInput!]!) {
@@ -440,12 +520,12 @@ class TestTaskMutations:
         assert bbox2["annotation"]["text"] == "car"
         assert "vehicle" in bbox2["annotation"]["tags"]
 
-    async def test_update_task(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_update_task(self):
         """Test updating a task."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         # Create a task first
         create_mutation = """
@@ -492,11 +572,11 @@ class TestTaskMutations:
         assert updated_task["bboxes"][0]["x"] == 100
         assert updated_task["bboxes"][0]["annotation"]["text"] == "updated object"
 
-    async def test_update_task_status_only(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_update_task_status_only(self):
         """Test updating only task status."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         # Create a task
         create_mutation = """
@@ -526,11 +606,11 @@ class TestTaskMutations:
         updated_task = update_result["updateTask"]
         assert updated_task["status"] == "FINISHED"
 
-    async def test_delete_task(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_delete_task(self):
         """Test deleting a task."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         # Create a task
         create_mutation = """
@@ -566,11 +646,11 @@ class TestTaskMutations:
         query_result = gql.query(query, {"id": task_id})
         assert query_result["task"] is None
 
-    async def test_task_status_enum_validation(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_task_status_enum_validation(self):
         """Test that TaskStatus enum values are properly validated."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
-        deps = await TestTaskMutations.set_up_dependencies(monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
+        deps = await TestTaskMutations.set_up_dependencies(gql)
 
         mutation = """
         mutation CreateTask($imageId: ID!, $projectId: ID!, $status: TaskStatus!) {
@@ -592,10 +672,10 @@ class TestTaskMutations:
             task = result["createTask"]
             assert task["status"] == status
 
-    async def test_create_task_invalid_references(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_task_invalid_references(self):
         """Test creating a task with invalid project/image references."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # First create a task with invalid references
         create_mutation = """
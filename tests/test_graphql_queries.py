@@ -2,17 +2,26 @@
 
 import pytest
 
+from satin.models.annotation import Annotation, BBox
+from satin.models.filters import StringFilterModel, StringFilterOperator
+from satin.models.image import Image, ImageDimensions
+from satin.models.project import Project
+from satin.models.task import Task, TaskStatus
+from satin.schema.filters import ListFilterOperator
+from satin.schema.query import _convert_tasks
+from satin.schema.task import Task as TaskType
+from satin.schema.utils import build_mongodb_filter_condition
 from tests.conftest import DatabaseFactory, TestDataFactory
 
 
 class TestProjectQueries:
     """Test GraphQL queries for projects."""
 
-    async def test_create_and_query_project(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_and_query_project(self):
         """Test creating a project and querying it back."""
         # Create test database and GraphQL client in the current event loop
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # First create a project
@@ -54,10 +63,10 @@ class TestProjectQueries:
         assert project["name"] == "My Project"
         assert project["description"] == "A test project"
 
-    async def test_query_nonexistent_project(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_nonexistent_project(self):
         """Test querying a project that doesn't exist."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query GetProject($id: ID!) {
@@ -72,10 +81,10 @@ class TestProjectQueries:
         result = gql.query(query, {"id": "507f1f77bcf86cd799439011"})
         assert result["project"] is None
 
-    async def test_query_projects_pagination(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_projects_pagination(self):
         """Test paginated projects query."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create multiple projects
@@ -132,10 +141,10 @@ class TestProjectQueries:
         assert projects_page["offset"] == 3
         assert projects_page["hasMore"] is False
 
-    async def test_query_projects_empty(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_projects_empty(self):
         """Test querying projects when none exist."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query GetProjects {
@@ -163,10 +172,10 @@ class TestProjectQueries:
 class TestImageQueries:
     """Test GraphQL queries for images."""
 
-    async def test_create_and_query_image(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_create_and_query_image(self):
         """Test creating an image and querying it back."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create an image
@@ -204,10 +213,10 @@ class TestImageQueries:
         assert image["id"] == image_id
         assert image["url"] == "https://example.com/my-image.jpg"
 
-    async def test_query_images_pagination(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_images_pagination(self):
         """Test paginated images query."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create multiple images
@@ -255,10 +264,26 @@ class TestImageQueries:
 class TestTaskQueries:
     """Test GraphQL queries for tasks."""
 
-    async def test_create_and_query_task(self, monkeypatch: pytest.MonkeyPatch):
+    def test_convert_tasks_matches_from_pydantic(self):
+        """Test that converting a page of tasks gives the same result as converting each task on its own."""
+        project = Project(id="p1", name="Project", description="Shared project")
+        images = [
+            Image(id="i1", url="https://example.com/1.jpg", dimensions=ImageDimensions(width=10, height=20)),
+            Image(id="i2", url="https://example.com/2.jpg"),
+        ]
+        bbox = BBox(x=1, y=2, width=3, height=4, annotation=Annotation(text="cat", tags=["animal"]))
+        tasks = [
+            Task(id="t1", image=images[0], project=project, bboxes=[bbox], status=TaskStatus.FINISHED),
+            Task(id="t2", image=images[1], project=project),
+            Task(id="t3", image=images[0], project=project),
+        ]
+
+        assert _convert_tasks(tasks) == [TaskType.from_pydantic(task) for task in tasks]
+
+    async def test_create_and_query_task(self):
         """Test creating a task and querying it back."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create dependencies first
@@ -366,10 +391,10 @@ class TestTaskQueries:
         assert len(task["bboxes"]) == 1
         assert task["createdAt"]  # Should have timestamp
 
-    async def test_query_tasks_pagination(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_tasks_pagination(self):
         """Test paginated tasks query."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create dependencies
@@ -439,10 +464,10 @@ class TestTaskQueries:
             assert task["project"]["id"] == project_id
             assert task["status"] in ["DRAFT", "FINISHED", "REVIEWED"]
 
-    async def test_query_task_field_selection(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_task_field_selection(self):
         """Test GraphQL field selection - only request specific fields."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Setup data
@@ -504,10 +529,10 @@ class TestTaskQueries:
 class TestPaginationEdgeCases:
     """Test edge cases for pagination functionality."""
 
-    async def test_pagination_offset_beyond_total(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_pagination_offset_beyond_total(self):
         """Test pagination when offset is beyond total items."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create only 3 projects
@@ -545,10 +570,10 @@ class TestPaginationEdgeCases:
         assert projects_page["offset"] == 10
         assert projects_page["hasMore"] is False
 
-    async def test_pagination_limit_larger_than_total(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_pagination_limit_larger_than_total(self):
         """Test pagination when limit is larger than total items."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create only 3 images
@@ -586,10 +611,10 @@ class TestPaginationEdgeCases:
         assert images_page["offset"] == 0
         assert images_page["hasMore"] is False
 
-    async def test_pagination_exact_page_boundary(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_pagination_exact_page_boundary(self):
         """Test pagination at exact page boundaries."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create exactly 6 projects (2 pages of 3)
@@ -635,10 +660,10 @@ class TestPaginationEdgeCases:
         assert page["totalCount"] == 6
         assert page["hasMore"] is False
 
-    async def test_pagination_zero_limit(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_pagination_zero_limit(self):
         """Test pagination with zero limit."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create some projects
@@ -672,10 +697,10 @@ class TestPaginationEdgeCases:
         assert page["totalCount"] == 3
         assert page["hasMore"] is True  # Still has more since we didn't fetch any
 
-    async def test_pagination_single_item_pages(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_pagination_single_item_pages(self):
         """Test pagination with single item per page."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # Create 3 images
@@ -725,10 +750,10 @@ class TestPaginationEdgeCases:
 class TestUniversalQueries:
     """Test universal query system with filtering and sorting."""
 
-    async def test_project_string_filter_contains(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_project_string_filter_contains(self):
         """Test string filtering with CONTAINS operator."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create test projects
         create_mutation = """
@@ -774,10 +799,10 @@ class TestUniversalQueries:
         assert len(projects["objects"]) == 1
         assert "Test Project Alpha" in projects["objects"][0]["name"]
 
-    async def test_project_sorting(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_project_sorting(self):
         """Test sorting projects by name."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create test projects with different names
         create_mutation = """
@@ -813,10 +838,10 @@ class TestUniversalQueries:
         names = [p["name"] for p in projects]
         assert names == sorted(names)  # Should be sorted alphabetically
 
-    async def test_project_combined_filter_and_sort(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_project_combined_filter_and_sort(self):
         """Test combining filters and sorting."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create test projects
         create_mutation = """
@@ -862,10 +887,10 @@ class TestUniversalQueries:
         assert names[0] == "Test Project Zebra"  # Should be first (DESC order)
         assert names[1] == "Test Project Alpha"  # Should be second
 
-    async def test_image_string_filter(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_image_string_filter(self):
         """Test filtering images by URL."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create test images
         create_mutation = """
@@ -908,10 +933,10 @@ class TestUniversalQueries:
         for image in images["objects"]:
             assert "example.com" in image["url"]
 
-    async def test_pagination_with_filters(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_pagination_with_filters(self):
         """Test pagination combined with filtering."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create 10 test projects with "Test" in name
         create_mutation = """
@@ -964,10 +989,10 @@ class TestUniversalQueries:
         assert projects["offset"] == 3
         assert projects["hasMore"] is True
 
-    async def test_backward_compatibility(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_backward_compatibility(self):
         """Test that legacy pagination still works."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create test projects
         create_mutation = """
@@ -1003,10 +1028,10 @@ class TestUniversalQueries:
         assert projects["limit"] == 2
         assert projects["offset"] == 0
 
-    async def test_string_filter_operators(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_string_filter_operators(self):
         """Test different string filter operators."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Create test projects
         create_mutation = """
@@ -1056,3 +1081,21 @@ class TestUniversalQueries:
         projects = result["projects"]
         assert projects["totalCount"] == 1
         assert projects["objects"][0]["name"] == "Test Beta"
+
+    def test_string_in_filter_sanitizes_repeated_values(self):
+        """Test that repeated IN values are all sanitized and keep their order."""
+        string_filter = StringFilterModel(field="name", operator=StringFilterOperator.IN, value=["<a>", " b ", "<a>"])
+
+        assert string_filter.value == ["&lt;a&gt;", "b", "&lt;a&gt;"]
+
+    @pytest.mark.parametrize(
+        ("operator", "value", "expected"),
+        [
+            (ListFilterOperator.CONTAINS_ALL, ["cat", "dog"], {"tags": {"$all": ["cat", "dog"]}}),
+            (ListFilterOperator.CONTAINS_ANY, "cat", {"tags": {"$in": ["cat"]}}),
+            (ListFilterOperator.SIZE_LT, 2, {"tags.1": {"$exists": False}}),
+        ],
+    )
+    def test_list_filter_condition(self, operator: ListFilterOperator, value, expected):
+        """Test MongoDB conditions built for list filters."""
+        assert build_mongodb_filter_condition("tags", operator, value) == expected
@@ -1,17 +1,15 @@
 """Tests for GraphQL schema introspection and validation."""
 
-import pytest
-
 from tests.conftest import DatabaseFactory, TestDataFactory
 
 
 class TestSchemaIntrospection:
     """Test GraphQL schema introspection queries."""
 
-    async def test_schema_query_types(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_schema_query_types(self):
         """Test that all expected query types are available."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectQuery {
@@ -36,10 +34,10 @@ class TestSchemaIntrospection:
         expected_queries = {"project", "projects", "image", "images", "task", "tasks"}
         assert expected_queries.issubset(query_fields)
 
-    async def test_schema_mutation_types(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_schema_mutation_types(self):
         """Test that all expected mutation types are available."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectMutation {
@@ -74,10 +72,10 @@ class TestSchemaIntrospection:
         }
         assert expected_mutations.issubset(mutation_fields)
 
-    async def test_task_status_enum(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_task_status_enum(self):
         """Test TaskStatus enum definition."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectTaskStatus {
@@ -102,10 +100,10 @@ class TestSchemaIntrospection:
         expected_values = {"DRAFT", "FINISHED", "REVIEWED"}
         assert enum_values == expected_values
 
-    async def test_page_type_structure(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_page_type_structure(self):
         """Test Page type structure for pagination."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # First get all types to find the correct Page type name
         query = """
@@ -141,10 +139,10 @@ class TestSchemaIntrospection:
         expected_fields = {"objects", "totalCount", "count", "limit", "offset", "hasMore"}
         assert expected_fields.issubset(field_names)
 
-    async def test_bbox_input_type(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_bbox_input_type(self):
         """Test BBoxInput input type structure."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectBBoxInput {
@@ -176,10 +174,10 @@ class TestSchemaIntrospection:
         expected_fields = {"x", "y", "width", "height", "annotation"}
         assert expected_fields == field_names
 
-    async def test_annotation_input_type(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_annotation_input_type(self):
         """Test AnnotationInput input type structure."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectAnnotationInput {
@@ -211,10 +209,10 @@ class TestSchemaIntrospection:
         expected_fields = {"text", "tags"}
         assert expected_fields == field_names
 
-    async def test_task_type_fields(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_task_type_fields(self):
         """Test Task type field definitions."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectTask {
@@ -246,10 +244,10 @@ class TestSchemaIntrospection:
         expected_fields = {"id", "image", "project", "bboxes", "status", "createdAt"}
         assert expected_fields.issubset(field_names)
 
-    async def test_query_field_arguments(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_field_arguments(self):
         """Test that query fields have correct arguments."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectProjectsQuery {
@@ -287,10 +285,10 @@ class TestSchemaIntrospection:
         offset_arg = next(arg for arg in projects_field["args"] if arg["name"] == "offset")
         assert offset_arg["defaultValue"] == "0"
 
-    async def test_mutation_field_arguments(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_mutation_field_arguments(self):
         """Test that mutation fields have correct arguments."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectCreateTaskMutation {
@@ -324,10 +322,10 @@ class TestSchemaIntrospection:
         expected_args = {"imageId", "projectId", "bboxes", "status"}
         assert expected_args.issubset(arg_names)
 
-    async def test_scalar_types(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_scalar_types(self):
         """Test that custom scalar types are properly defined."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query IntrospectScalars {
@@ -351,10 +349,10 @@ class TestSchemaIntrospection:
 class TestSchemaValidation:
     """Test schema validation and error handling."""
 
-    async def test_invalid_query_field(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_invalid_query_field(self):
         """Test querying a non-existent field."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query InvalidField {
@@ -371,10 +369,10 @@ class TestSchemaValidation:
         assert len(errors) > 0
         assert "nonExistentField" in str(errors[0])
 
-    async def test_invalid_mutation_field(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_invalid_mutation_field(self):
         """Test calling a non-existent mutation."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         mutation = """
         mutation InvalidMutation {
@@ -390,10 +388,10 @@ class TestSchemaValidation:
         assert errors is not None
         assert "nonExistentMutation" in str(errors[0])
 
-    async def test_invalid_enum_value(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_invalid_enum_value(self):
         """Test using invalid enum value."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
         test_data = TestDataFactory()
 
         # First create dependencies
@@ -433,10 +431,10 @@ class TestSchemaValidation:
         assert errors is not None
         assert "INVALID_STATUS" in str(errors[0])
 
-    async def test_missing_required_arguments(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_missing_required_arguments(self):
         """Test mutation with missing required arguments."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         mutation = """
         mutation CreateProjectMissingArgs {
@@ -453,10 +451,10 @@ class TestSchemaValidation:
         assert errors is not None
         assert "description" in str(errors[0]).lower()
 
-    async def test_type_coercion_errors(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_type_coercion_errors(self):
         """Test invalid type coercion."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         mutation = """
         mutation CreateImageInvalidType($url: Int!) {
@@ -475,10 +473,10 @@ class TestSchemaValidation:
 class TestUniversalQuerySchema:
     """Test GraphQL schema for universal query types."""
 
-    async def test_query_input_type_exists(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_query_input_type_exists(self):
         """Test that QueryInput type is properly defined."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Test introspection query for QueryInput type
         query = """
@@ -503,10 +501,10 @@ class TestUniversalQuerySchema:
         assert query_input_type["name"] == "QueryInput"
         assert query_input_type["kind"] == "INPUT_OBJECT"
 
-    async def test_filter_operator_enums_exist(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_filter_operator_enums_exist(self):
         """Test that filter operator enums are properly defined."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Test StringFilterOperatorEnum enum
         query = """
@@ -560,10 +558,10 @@ class TestUniversalQuerySchema:
         assert "GTE" in enum_values
         assert "LTE" in enum_values
 
-    async def test_sort_direction_enum(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_sort_direction_enum(self):
         """Test that SortDirectionEnum enum is properly defined."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query {
@@ -587,10 +585,10 @@ class TestUniversalQuerySchema:
         assert "ASC" in enum_values
         assert "DESC" in enum_values
 
-    async def test_projects_query_accepts_query_input(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_projects_query_accepts_query_input(self):
         """Test that projects query accepts QueryInput parameter."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         # Test introspection of projects field
         query = """
@@ -628,10 +626,10 @@ class TestUniversalQuerySchema:
         assert "limit" in arg_names  # Legacy compatibility
         assert "offset" in arg_names  # Legacy compatibility
 
-    async def test_images_and_tasks_query_accept_query_input(self, monkeypatch: pytest.MonkeyPatch):
+    async def test_images_and_tasks_query_accept_query_input(self):
         """Test that images and tasks queries accept QueryInput parameter."""
         db, client = await DatabaseFactory.create_test_db()
-        gql = DatabaseFactory.create_graphql_client(db, monkeypatch)
+        gql = DatabaseFactory.create_graphql_client(db)
 
         query = """
         query {
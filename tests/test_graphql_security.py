@@ -0,0 +1,57 @@
+"""Tests for the GraphQL security validation rules."""
+
+from graphql import parse, validate
+
+from satin.main import schema
+from satin.middleware.graphql_security import get_security_validation_rules
+
+NESTED_QUERY = """
+query {
+    tasks {
+        objects {
+            image { id url }
+            project { ... on Project { id name } }
+        }
+    }
+}
+"""
+
+
+def _security_errors(query: str, **limits: int) -> list[str]:
+    """Validate a query against the security rules only and return the error messages."""
+    errors = validate(schema._schema, parse(query), get_security_validation_rules(**limits))
+    return [error.message for error in errors]
+
+
+class TestSecurityAnalysisRule:
+    """Test cases for the fused depth, complexity and alias rule."""
+
+    def test_query_within_limits(self):
+        """Test that a typical query passes with the default limits."""
+        assert _security_errors(NESTED_QUERY) == []
+
+    def test_depth_limit(self):
+        """Test that fields nested deeper than the limit are reported."""
+        errors = _security_errors(NESTED_QUERY, max_depth=3)
+
+        assert errors == [
+            "Query depth of 4 exceeds maximum allowed depth of 3",
+            "Query depth of 4 exceeds maximum allowed depth of 3",
+            "Query depth of 5 exceeds maximum allowed depth of 3",
+            "Query depth of 5 exceeds maximum allowed depth of 3",
+        ]
+
+    def test_complexity_limit(self):
+        """Test that the complexity includes nesting and list fields."""
+        # tasks: 1 + 2 + 5, objects: 1 + 4 + 5
+        errors = _security_errors("query { tasks { objects { id } } }", max_complexity=18)
+
+        assert errors == ["Query complexity of 25 exceeds maximum allowed complexity of 18"]
+
+    def test_alias_limit(self):
+        """Test that aliases beyond the limit are reported."""
+        query = 'query { a: project(id: "1") { id } b: project(id: "2") { id } c: project(id: "3") { id } }'
+
+        errors = _security_errors(query, max_aliases=2)
+
+        assert errors == ["Query uses 3 aliases, exceeding maximum of 2"]
@@ -1,6 +1,6 @@
 from bson import ObjectId
 
-from satin.models.image import Image
+from satin.models.image import Image, ImageDimensions, ImageMetadata
 from satin.repositories import ImageRepository
 from tests.conftest import DatabaseFactory
 
@@ -54,6 +54,28 @@ class TestImageFunctions:
         assert retrieved_image.id == created_image.id
         assert str(retrieved_image.url) == "https://example.com/test-image.jpg"
 
+    async def test_get_image_with_metadata(self):
+        """Test that stored dimensions and metadata are read back as models."""
+        db, client = await DatabaseFactory.create_test_db()
+        image_repo = ImageRepository(db)
+
+        created_image = await image_repo.create_image(
+            "/uploads/photo.png",
+            metadata={
+                "dimensions": {"width": 640, "height": 480},
+                "metadata": {"filename": "photo.png", "size": 1024, "mime_type": "image/png", "is_uploaded": True},
+            },
+        )
+
+        retrieved_image = await image_repo.get_image(created_image.id)
+
+        assert retrieved_image.id == created_image.id
+        assert isinstance(retrieved_image.dimensions, ImageDimensions)
+        assert retrieved_image.dimensions.width == 640
+        assert isinstance(retrieved_image.metadata, ImageMetadata)
+        assert retrieved_image.metadata.filename == "photo.png"
+        assert retrieved_image.metadata.format is None
+
     async def test_get_image_not_found(self):
         """Test retrieving a non-existent image."""
         db, client = await DatabaseFactory.create_test_db()
@@ -68,6 +68,18 @@ class TestProjectFunctions:
         assert retrieved_project.name == "Test Project"
         assert retrieved_project.description == "Test description"
 
+    async def test_get_project_by_object_id(self):
+        """Test retrieving a project by an already converted ObjectId."""
+        db, client = await DatabaseFactory.create_test_db()
+        project_repo = ProjectRepository(db)
+
+        created_project = await project_repo.create_project("Test Project", "Test description")
+
+        retrieved_project = await project_repo.get_project(ObjectId(created_project.id))
+
+        assert retrieved_project is not None
+        assert retrieved_project.id == created_project.id
+
     async def test_get_project_not_found(self):
         """Test retrieving a non-existent project."""
         db, client = await DatabaseFactory.create_test_db()
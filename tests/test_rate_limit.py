@@ -0,0 +1,196 @@
+"""Tests for the rate limiting middleware helpers."""
+
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from satin.middleware import rate_limit
+from satin.middleware.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimitMiddleware,
+    extract_graphql_query,
+    get_query_complexity_score,
+)
+
+
+class TestInMemoryRateLimitStore:
+    """Test cases for InMemoryRateLimitStore."""
+
+    def test_incr_accumulates_within_window(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that increments in the same window add up."""
+        monkeypatch.setattr(rate_limit.time, "time", lambda: 1000.0)
+        store = InMemoryRateLimitStore()
+
+        assert store.incr("client", window=60) == 1
+        assert store.incr("client", window=60, amount=4) == 5
+        assert store.get("client") == 5
+        assert store.get("other") == 0
+
+    def test_expired_windows_are_dropped(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that counts older than the window no longer count."""
+        now = [1000.0]
+        monkeypatch.setattr(rate_limit.time, "time", lambda: now[0])
+        store = InMemoryRateLimitStore()
+        store.incr("client", window=10, amount=3)
+
+        now[0] += 5
+        assert store.incr("client", window=10) == 4
+
+        now[0] += 20
+        assert store.get("client") == 0
+        assert store.incr("client", window=10) == 1
+
+    def test_window_starts_at_first_increment(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a window lasts its full duration from the first increment."""
+        now = [1009.0]
+        monkeypatch.setattr(rate_limit.time, "time", lambda: now[0])
+        store = InMemoryRateLimitStore()
+        store.incr("client", window=10)
+
+        now[0] = 1018.0
+        assert store.incr("client", window=10) == 2
+
+        now[0] = 1019.0
+        assert store.incr("client", window=10) == 1
+
+    def test_reset(self):
+        """Test that reset clears a key."""
+        store = InMemoryRateLimitStore()
+        store.incr("client")
+        store.reset("client")
+        assert store.get("client") == 0
+
+
+class TestExtractGraphQLQuery:
+    """Test cases for extract_graphql_query."""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"query": "{ projects { objects { id } } }"},
+            {"query": 'query {\n  project(id: "1") {\n    name\n  }\n}', "variables": {"id": "1"}},
+            {"variables": {"name": 'a "quoted" name'}, "query": 'mutation { deleteProject(id: "1") }'},
+            {"query": '{ project(id: "caf\u00e9") { name } }'},
+        ],
+    )
+    def test_matches_full_json_parse(self, payload: dict):
+        """Test that the extracted query matches the one json.loads would return."""
+        for body in (json.dumps(payload).encode(), json.dumps(payload, ensure_ascii=False).encode()):
+            assert extract_graphql_query(body) == payload["query"]
+
+    def test_body_without_query(self):
+        """Test that a body without a query yields an empty string."""
+        assert extract_graphql_query(b'{"variables": {}}') == ""
+        assert extract_graphql_query(b"[]") == ""
+        assert extract_graphql_query(b'{"query": 1}') == ""
+
+    def test_ignores_nested_query_keys(self):
+        """Test that a query key nested in the variables is not mistaken for the query."""
+        body = b'{"variables": {"query": "x"}, "query": "{ projects { objects { id } } }"}'
+        assert extract_graphql_query(body) == "{ projects { objects { id } } }"
+
+    def test_duplicate_query_keys_use_last(self):
+        """Test that the query the GraphQL server executes, the last one, is extracted."""
+        assert extract_graphql_query(b'{"query": "x", "query": "{ projects { count } }"}') == "{ projects { count } }"
+
+    def test_invalid_body_raises(self):
+        """Test that a body that is not JSON raises a decode error."""
+        with pytest.raises(ValueError, match="line 1 column"):
+            extract_graphql_query(b"not json")
+
+    def test_invalid_utf8_raises(self):
+        """Test that a query that is not valid UTF-8 raises a decode error."""
+        with pytest.raises(ValueError, match="invalid unicode"):
+            extract_graphql_query(b'{"query": "\xff"}')
+
+
+class TestQueryComplexityScore:
+    """Test cases for get_query_complexity_score."""
+
+    def test_empty_query(self):
+        """Test that an empty query has the minimum score."""
+        assert get_query_complexity_score("") == 1
+
+    def test_operation_keywords(self):
+        """Test that mutations and subscriptions cost more, regardless of case."""
+        assert get_query_complexity_score("{ a }") == 3
+        assert get_query_complexity_score("MUTATION { a }") == 8
+        assert get_query_complexity_score("Subscription { a }") == 13
+
+    def test_score_is_capped(self):
+        """Test that the score never exceeds the cap."""
+        assert get_query_complexity_score("{" * 500) == 100
+
+
+class TestRateLimitMiddleware:
+    """Test cases for RateLimitMiddleware."""
+
+    @staticmethod
+    def create_client(monkeypatch: pytest.MonkeyPatch, **limits: int) -> TestClient:
+        """Create a client for an echo app behind the middleware with rate limiting enabled."""
+        monkeypatch.setattr(rate_limit, "rate_limit_store", InMemoryRateLimitStore())
+
+        async def echo(request: Request) -> Response:
+            return Response(await request.body())
+
+        app = Starlette(routes=[Route("/graphql", echo, methods=["POST"]), Route("/health", echo)])
+        return TestClient(RateLimitMiddleware(app, disabled=False, **limits))
+
+    def test_graphql_body_reaches_app(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that the body read for complexity analysis is still passed on."""
+        client = self.create_client(monkeypatch)
+        body = b'{"query": "{ projects { objects { id } } }"}'
+
+        response = client.post("/graphql", content=body)
+
+        assert response.status_code == 200
+        assert response.content == body
+
+    async def test_chunked_graphql_body_reaches_app(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a body received in several messages is replayed in full."""
+        monkeypatch.setattr(rate_limit, "rate_limit_store", InMemoryRateLimitStore())
+        chunks = [b'{"query": "{ projects ', b"{ objects { id } } }", b'"}']
+        messages = [
+            {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+            for index, chunk in enumerate(chunks)
+        ]
+        received: list[dict] = []
+
+        async def app(_scope, receive, _send):
+            received.extend([await receive() for _ in chunks])
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(_message):
+            pass
+
+        scope = {"type": "http", "method": "POST", "path": "/graphql", "headers": [], "client": ("127.0.0.1", 1234)}
+        await RateLimitMiddleware(app, disabled=False)(scope, receive, send)
+
+        assert b"".join(message["body"] for message in received) == b"".join(chunks)
+
+    def test_graphql_limit_exceeded(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that requests over the GraphQL limit get a 429 response."""
+        client = self.create_client(monkeypatch, graphql_limit=1)
+
+        assert client.post("/graphql", content=b'{"query": "{ a }"}').status_code == 200
+        response = client.post("/graphql", content=b'{"query": "{ a }"}')
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "60"
+        assert response.json() == {
+            "error": "Rate limit exceeded",
+            "message": "GraphQL rate limit exceeded: 2/1 per minute",
+        }
+
+    def test_health_check_not_limited(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that health checks bypass the limits."""
+        client = self.create_client(monkeypatch, burst_limit=0)
+
+        assert client.get("/health").status_code == 200
@@ -0,0 +1,54 @@
+"""Tests for the security headers middleware."""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from satin.middleware.security import SecurityHeadersMiddleware
+
+
+def create_client(*, nonce_enabled: bool, connect_origins: list[str] | None = None) -> TestClient:
+    """Create a client for an app that echoes the request's CSP nonce."""
+    app = FastAPI()
+
+    @app.get("/nonce")
+    async def nonce(request: Request) -> dict:
+        return {"nonce": getattr(request.state, "csp_nonce", None)}
+
+    return TestClient(
+        SecurityHeadersMiddleware(
+            app,
+            nonce_enabled=nonce_enabled,
+            connect_origins=["https://satin.example.com"] if connect_origins is None else connect_origins,
+        )
+    )
+
+
+class TestSecurityHeadersMiddleware:
+    """Test cases for SecurityHeadersMiddleware."""
+
+    def test_static_csp(self):
+        """Test that the CSP allows inline scripts when nonces are disabled."""
+        response = create_client(nonce_enabled=False).get("/nonce")
+
+        csp = response.headers["content-security-policy"]
+        assert response.json() == {"nonce": None}
+        assert "script-src 'self' 'unsafe-inline';" in csp
+        assert "connect-src 'self' https://satin.example.com;" in csp
+
+    def test_csp_without_connect_origins(self):
+        """Test that connect-src only allows the app itself when there are no origins."""
+        response = create_client(nonce_enabled=False, connect_origins=[]).get("/nonce")
+
+        assert "connect-src 'self'; frame-src" in response.headers["content-security-policy"]
+
+    def test_csp_nonce(self):
+        """Test that every request gets its own nonce in the CSP and the request state."""
+        client = create_client(nonce_enabled=True)
+
+        first = client.get("/nonce")
+        second = client.get("/nonce")
+
+        first_nonce = first.json()["nonce"]
+        assert first_nonce != second.json()["nonce"]
+        assert f"script-src 'self' 'nonce-{first_nonce}'; style-src" in first.headers["content-security-policy"]
+        assert first.headers["x-frame-options"] == "DENY"
@@ -4,10 +4,11 @@ import pytest
 from bson import ObjectId
 
 from satin.models.annotation import Annotation, BBox
+from satin.models.filters import QueryModel, SortDirection, SortModel
 from satin.models.image import Image
 from satin.models.project import Project
 from satin.models.task import Task, TaskStatus
-from satin.repositories import ImageRepository, ProjectRepository, TaskRepository
+from satin.repositories import ImageRepository, ProjectRepository, RepositoryFactory, TaskRepository
 from tests.conftest import DatabaseFactory
 
 
@@ -153,6 +154,31 @@ class TestTaskFunctions:
         task_statuses = {t.status for t in tasks}
         assert task_statuses == {TaskStatus.DRAFT, TaskStatus.FINISHED, TaskStatus.REVIEWED}
 
+    async def test_get_all_tasks_sorted_and_paginated(self):
+        """Test sorting tasks by their own and by joined fields, one page at a time."""
+        db, client = await DatabaseFactory.create_test_db()
+        repo_factory = RepositoryFactory(db)
+        project = await get_sample_project(repo_factory.project_repo)
+        for url in ("https://example.com/b.jpg", "https://example.com/c.jpg", "https://example.com/a.jpg"):
+            image = await repo_factory.image_repo.create_image(url)
+            await repo_factory.task_repo.create_task(image_id=image.id, project_id=project.id)
+
+        by_image_url = QueryModel(sorts=[SortModel(field="image.url", direction=SortDirection.DESC)], limit=2)
+        by_creation = QueryModel(sorts=[SortModel(field="created_at")], limit=2, offset=1)
+
+        tasks_by_image_url = await repo_factory.task_repo.get_all_tasks(query_input=by_image_url)
+        tasks_by_creation = await repo_factory.task_repo.get_all_tasks(query_input=by_creation)
+
+        assert [task.image.url for task in tasks_by_image_url] == [
+            "https://example.com/c.jpg",
+            "https://example.com/b.jpg",
+        ]
+        assert [task.image.url for task in tasks_by_creation] == [
+            "https://example.com/c.jpg",
+            "https://example.com/a.jpg",
+        ]
+        assert all(task.project.id == project.id for task in tasks_by_creation)
+
     async def test_get_all_tasks_empty(self):
         """Test retrieving all tasks when none exist."""
         db, client = await DatabaseFactory.create_test_db()
@@ -291,3 +317,34 @@ class TestTaskFunctions:
         # Should now be 2
         count = await task_repo.count_all_tasks()
         assert count == 2
+
+    async def test_factory_task_repo_shares_related_repositories(self):
+        """Test that tasks see image updates made through the same factory."""
+        db, client = await DatabaseFactory.create_test_db()
+        repo_factory = RepositoryFactory(db)
+
+        assert repo_factory.task_repo._image_repo is repo_factory.image_repo
+        assert repo_factory.task_repo._project_repo is repo_factory.project_repo
+
+        image = await get_sample_image(repo_factory.image_repo)
+        project = await get_sample_project(repo_factory.project_repo)
+        task = await repo_factory.task_repo.create_task(image.id, project.id)
+
+        # Populate the image cache, then update the image
+        await repo_factory.task_repo.get_task(task.id)
+        await repo_factory.image_repo.update_image(image.id, url="https://example.com/updated.jpg")
+
+        updated_task = await repo_factory.task_repo.get_task(task.id)
+        assert updated_task is not None
+        assert str(updated_task.image.url) == "https://example.com/updated.jpg"
+
+    async def test_ensure_indexes(self):
+        """Test that the factory creates the task indexes, and that doing it twice is harmless."""
+        db, client = await DatabaseFactory.create_test_db()
+        repo_factory = RepositoryFactory(db)
+
+        await repo_factory.ensure_indexes()
+        await repo_factory.ensure_indexes()
+
+        indexes = await db["tasks"].index_information()
+        assert {"image_id_1_project_id_1", "project_id_1"} <= indexes.keys()